@@ -3,7 +3,12 @@ Coral taxonomy management system for marine coral classification
 Complete database of ornamental and reef-building coral species
 """
 from typing import Dict, List, Optional, Tuple, Any
-from .taxonomy_manager import TaxonomyManager, SpeciesInfo
+from .taxonomy_manager import (
+    TaxonomyManager,
+    SpeciesInfo,
+    _common_name_key,
+    _order_from_path,
+)
 
 
 class CoralTaxonomyManager(TaxonomyManager):
@@ -591,13 +596,13 @@ class CoralTaxonomyManager(TaxonomyManager):
                 # 기본 리스트 형태: 기존 방식 유지
                 if isinstance(node, list):
                     common_names = node
-                    species_info = SpeciesInfo(
-                        genus=genus_name,
-                        species=species_name,
-                        common_names=common_names,
-                        family=family_name,
-                        order=order_name,
-                        class_name=class_name,
+                    species_info = self._create_species_info(
+                        genus_name,
+                        species_name,
+                        common_names,
+                        family_name,
+                        order_name,
+                        class_name,
                     )
                     self._add_to_indexes(species_info)
                     continue
@@ -607,13 +612,13 @@ class CoralTaxonomyManager(TaxonomyManager):
                     common_names = node.get("__common__", [])
                     variants = node.get("__variants__", {})
 
-                    species_info = SpeciesInfo(
-                        genus=genus_name,
-                        species=species_name,
-                        common_names=common_names,
-                        family=family_name,
-                        order=order_name,
-                        class_name=class_name,
+                    species_info = self._create_species_info(
+                        genus_name,
+                        species_name,
+                        common_names,
+                        family_name,
+                        order_name,
+                        class_name,
                     )
                     self._add_to_indexes(species_info)
 
@@ -633,10 +638,9 @@ class CoralTaxonomyManager(TaxonomyManager):
 
             # 변이명과 별칭들을 공용명 인덱스에 추가 (검색 용이)
             for name in [variant_name] + alias_list:
-                name_lower = name.lower()
-                if name_lower not in self.common_name_index:
-                    self.common_name_index[name_lower] = []
-                self.common_name_index[name_lower].append(species_info)
+                self.common_name_index.setdefault(
+                    _common_name_key(name), []
+                ).append(species_info)
 
     def get_variants(self, genus: str, species: str) -> List[str]:
         """해당 종의 변이(트레이드 네임) 목록 반환"""
@@ -652,7 +656,7 @@ class CoralTaxonomyManager(TaxonomyManager):
 
     def _build_indexes(self):
         """산호 전용 인덱스 생성 (Anthozoa 처리)"""
-        self.species_index: Dict[str, SpeciesInfo] = {}
+        self.species_index: Dict[Tuple[str, str], SpeciesInfo] = {}
         self.genus_index: Dict[str, List[SpeciesInfo]] = {}
         self.family_index: Dict[Tuple[str, str, str], List[SpeciesInfo]] = {}
         self.common_name_index: Dict[str, List[SpeciesInfo]] = {}
@@ -662,11 +666,23 @@ class CoralTaxonomyManager(TaxonomyManager):
         if anthozoa_data:
             self._process_coral_data(anthozoa_data, "Anthozoa")
 
+        self._finalize_indexes()
+
         self.logger.info(f"분류 체계 인덱스 생성 완료: {len(self.species_index)}종")
 
+    def _snapshot_extra(self) -> Dict[str, Any]:
+        """변이 매핑은 분류 트리 밖에 있으므로 스냅샷에 함께 저장"""
+        return {"variants_map": self.variants_map}
+
+    def _index_merged_species(self, merged_species):
+        """산호 데이터는 변이(dict) 노드를 포함하므로 병합 후 전체 재색인"""
+        self._build_indexes()
+
     def _process_coral_data(self, data, class_name):
         """Anthozoa 데이터 재귀 처리"""
-        def find_families_recursive(current_data: Dict[str, Any]):
+        def find_families_recursive(
+            current_data: Dict[str, Any], path: Tuple[str, ...]
+        ):
             """재귀적으로 모든 과(Family) 찾기"""
             for key, value in current_data.items():
                 if not isinstance(value, dict):
@@ -674,20 +690,19 @@ class CoralTaxonomyManager(TaxonomyManager):
                 
                 # 과(Family) 감지 - 'idae'로 끝나는 것
                 if key.endswith('idae'):
-                    # 과를 찾았으면 상위 목(order) 찾기
-                    order_name = self._find_order_name(data, key)
+                    # 내려온 경로로 상위 목(order) 결정 (트리를 다시 탐색하지 않음)
                     self._process_family_data(
                         value,
                         key,
-                        order_name,
+                        _order_from_path(path),
                         class_name,
                     )
                 else:
                     # 과가 아니면 더 깊이 탐색
-                    find_families_recursive(value)
+                    find_families_recursive(value, path + (key,))
         
         # 재귀 탐색 시작
-        find_families_recursive(data)
+        find_families_recursive(data, ())
 
     def get_all_families(self, ornamental_only: bool = True):
         """산호(Anthozoa) 과 목록 반환 (class, order, family)
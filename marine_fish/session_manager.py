@@ -4,16 +4,43 @@ Session management for marine fish scraper
 """
 
 import json
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from .logger import get_logger
 from .taxonomy_manager import SpeciesInfo
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
-@dataclass
+
+def _dump_log_line(record: Dict[str, Any]) -> bytes:
+    """진행 로그 한 줄(NDJSON) 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(record) + b'\n'
+    return json.dumps(record).encode('utf-8') + b'\n'
+
+
+def _dump_fragment(obj: Any) -> bytes:
+    """JSON 조각 직렬화 (공백 없이)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _load_log_line(line: bytes) -> Dict[str, Any]:
+    """진행 로그 한 줄(NDJSON) 역직렬화"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+@dataclass(slots=True)
 class ScrapingSession:
     """스크래핑 세션 정보"""
     session_id: str
@@ -37,10 +64,20 @@ class ScrapingSession:
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
-        data = asdict(self)
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        return data
+        # __slots__ 기반이므로 asdict 대신 필드를 직접 나열
+        return {
+            'session_id': self.session_id,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+            'target_species': self.target_species,
+            'images_per_species': self.images_per_species,
+            'total_species': self.total_species,
+            'completed_species': self.completed_species,
+            'total_downloaded': self.total_downloaded,
+            'current_species_index': self.current_species_index,
+            'status': self.status,
+            'error_message': self.error_message,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ScrapingSession':
@@ -77,6 +114,83 @@ class SessionManager:
         
         # 현재 활성 세션
         self.current_session: Optional[ScrapingSession] = None
+
+        # 진행 상황 추가 기록용 로그 (append-only NDJSON)
+        self._log_fd = None
+        self._log_session_id: Optional[str] = None
+
+        # 현재 세션 target_species의 미리 직렬화된 JSON 조각
+        # (세션 동안 변하지 않으므로 저장 시 재인코딩하지 않음)
+        self._species_fragments: List[bytes] = []
+        self._fragments_session_id: Optional[str] = None
+
+    def _get_log_file(self, session_id: str) -> Path:
+        """세션 진행 로그 파일 경로"""
+        return self.sessions_dir / f"session_{session_id}.log.ndjson"
+
+    def _open_progress_log(self, session_id: str):
+        """진행 로그를 추가 모드로 열기"""
+        self._close_progress_log()
+        try:
+            self._log_fd = open(self._get_log_file(session_id), 'ab')
+            self._log_session_id = session_id
+        except OSError as e:
+            self.logger.warning(f"진행 로그 열기 실패: {session_id} - {e}")
+
+    def _close_progress_log(self):
+        """진행 로그 닫기"""
+        if self._log_fd is not None:
+            try:
+                self._log_fd.close()
+            except OSError:
+                pass
+        self._log_fd = None
+        self._log_session_id = None
+
+    def _prepare_species_fragments(self, session: ScrapingSession):
+        """target_species 각 항목을 JSON 조각으로 한 번만 직렬화"""
+        self._species_fragments = [_dump_fragment(species) for species in session.target_species]
+        self._fragments_session_id = session.session_id
+
+    def _encode_session(self, session: ScrapingSession) -> bytes:
+        """세션을 JSON 바이트로 인코딩"""
+        data = session.to_dict()
+        use_fragments = self._fragments_session_id == session.session_id
+        if use_fragments:
+            data['target_species'] = []
+
+        if orjson is not None:
+            encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            encoded = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+        if use_fragments:
+            # 빈 자리표시자에 미리 직렬화된 조각을 그대로 이어붙임
+            encoded = encoded.replace(
+                b'"target_species": []',
+                b'"target_species": [' + b','.join(self._species_fragments) + b']',
+                1,
+            )
+        return encoded
+
+    def _read_last_progress(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """진행 로그의 마지막 유효 레코드 반환"""
+        log_file = self._get_log_file(session_id)
+        if not log_file.exists():
+            return None
+
+        with open(log_file, 'rb') as f:
+            lines = f.read().splitlines()
+
+        # 기록 도중 중단된 마지막 줄은 건너뜀
+        for line in reversed(lines):
+            if not line:
+                continue
+            try:
+                return _load_log_line(line)
+            except ValueError:
+                continue
+        return None
     
     def create_session(self, target_species: List[SpeciesInfo], images_per_species: int) -> ScrapingSession:
         """새 세션 생성"""
@@ -99,7 +213,9 @@ class SessionManager:
         )
         
         self.current_session = session
+        self._prepare_species_fragments(session)
         self.save_session(session)
+        self._open_progress_log(session_id)
         
         self.logger.info(f"새 세션 생성: {session_id} ({len(target_species)}종)")
         return session
@@ -111,11 +227,15 @@ class SessionManager:
             
             # 임시 파일에 먼저 저장
             temp_file = session_file.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(session.to_dict(), f, ensure_ascii=False, indent=2)
+            with open(temp_file, 'wb') as f:
+                f.write(self._encode_session(session))
             
             # 성공하면 원본 파일로 이동
             temp_file.replace(session_file)
+
+            # 전체 저장이 끝났으므로 진행 로그는 비움 (compaction)
+            if self._log_fd is not None and self._log_session_id == session.session_id:
+                self._log_fd.truncate(0)
             
             self.logger.debug(f"세션 저장 완료: {session.session_id}")
             return True
@@ -137,7 +257,25 @@ class SessionManager:
                 data = json.load(f)
             
             session = ScrapingSession.from_dict(data)
+
+            # 진행 로그가 남아 있으면 마지막 상태를 반영하고 메타 파일로 합침
+            progress = self._read_last_progress(session_id)
+            if progress is not None:
+                session.update_progress(progress['c'], progress['d'])
+                session.updated_at = datetime.fromtimestamp(progress['t'])
+
             self.current_session = session
+            self._prepare_species_fragments(session)
+            if session.status in ('completed', 'failed'):
+                # 끝난 세션에는 더 기록할 진행 상황이 없으므로 로그를 열지 않음
+                self._close_progress_log()
+                if progress is not None:
+                    self.save_session(session)
+                    self._get_log_file(session_id).unlink(missing_ok=True)
+            else:
+                self._open_progress_log(session_id)
+                if progress is not None:
+                    self.save_session(session)
             
             self.logger.info(f"세션 로드 완료: {session_id}")
             return session
@@ -156,9 +294,20 @@ class SessionManager:
                     with open(session_file, 'r', encoding='utf-8') as f:
                         data = json.load(f)
                     
+                    session_id = data.get('session_id')
+                    if not session_id:
+                        self.logger.warning(f"세션 ID 없는 세션 파일 건너뜀: {session_file.name}")
+                        continue
+
+                    # 진행 로그가 있으면 최신 진행 상황 반영
+                    progress = self._read_last_progress(session_id)
+                    if progress is not None:
+                        data['completed_species'] = progress['c']
+                        data['total_downloaded'] = progress['d']
+
                     # 기본 정보만 추출
                     session_info = {
-                        'session_id': data.get('session_id'),
+                        'session_id': session_id,
                         'created_at': data.get('created_at'),
                         'status': data.get('status'),
                         'total_species': data.get('total_species', 0),
@@ -186,11 +335,18 @@ class SessionManager:
             
             if session_file.exists():
                 session_file.unlink()
-                self.logger.info(f"세션 삭제 완료: {session_id}")
                 
                 # 현재 세션이 삭제된 세션이면 초기화
                 if self.current_session and self.current_session.session_id == session_id:
                     self.current_session = None
+                if self._log_session_id == session_id:
+                    self._close_progress_log()
+
+                log_file = self._get_log_file(session_id)
+                if log_file.exists():
+                    log_file.unlink()
+
+                self.logger.info(f"세션 삭제 완료: {session_id}")
                 
                 return True
             else:
@@ -206,16 +362,25 @@ class SessionManager:
         if self.current_session and self.current_session.session_id == session_id:
             self.current_session.status = 'paused'
             self.current_session.updated_at = datetime.now()
-            return self.save_session(self.current_session)
+            saved = self.save_session(self.current_session)
+            self._close_progress_log()
+            return saved
         return False
     
     def resume_session(self, session_id: str) -> bool:
         """세션 재시작"""
-        session = self.load_session(session_id)
+        # 이미 활성 세션이면 파일을 다시 읽지 않음
+        if self.current_session and self.current_session.session_id == session_id:
+            session = self.current_session
+        else:
+            session = self.load_session(session_id)
         if session and session.status == 'paused':
             session.status = 'running'
             session.updated_at = datetime.now()
-            return self.save_session(session)
+            saved = self.save_session(session)
+            if self._log_session_id != session_id:
+                self._open_progress_log(session_id)
+            return saved
         return False
     
     def complete_session(self, session_id: str) -> bool:
@@ -223,7 +388,9 @@ class SessionManager:
         if self.current_session and self.current_session.session_id == session_id:
             self.current_session.status = 'completed'
             self.current_session.updated_at = datetime.now()
-            return self.save_session(self.current_session)
+            saved = self.save_session(self.current_session)
+            self._close_progress_log()
+            return saved
         return False
     
     def fail_session(self, session_id: str, error_message: str) -> bool:
@@ -232,14 +399,37 @@ class SessionManager:
             self.current_session.status = 'failed'
             self.current_session.error_message = error_message
             self.current_session.updated_at = datetime.now()
-            return self.save_session(self.current_session)
+            saved = self.save_session(self.current_session)
+            self._close_progress_log()
+            return saved
         return False
     
     def update_current_session_progress(self, completed_species: int, total_downloaded: int):
-        """현재 세션의 진행 상황 업데이트"""
-        if self.current_session:
-            self.current_session.update_progress(completed_species, total_downloaded)
-            self.save_session(self.current_session)
+        """현재 세션의 진행 상황 업데이트
+
+        세션 파일 전체를 다시 쓰지 않고 진행 로그에 한 줄만 추가한다.
+        로그는 세션 로드/일시정지/완료 시 메타 파일로 합쳐진다.
+        """
+        if not self.current_session:
+            return
+
+        session = self.current_session
+        session.update_progress(completed_species, total_downloaded)
+
+        if session.status == 'completed' or self._log_session_id != session.session_id:
+            self.save_session(session)
+            return
+
+        try:
+            self._log_fd.write(_dump_log_line({
+                't': time.time(),
+                'c': completed_species,
+                'd': total_downloaded,
+            }))
+            self._log_fd.flush()
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"진행 로그 기록 실패, 전체 저장으로 대체: {session.session_id} - {e}")
+            self.save_session(session)
     
     def get_current_session(self) -> Optional[ScrapingSession]:
         """현재 활성 세션 반환"""
@@ -256,6 +446,9 @@ class SessionManager:
                     # 파일 수정 시간 확인
                     if session_file.stat().st_mtime < cutoff_date:
                         session_file.unlink()
+                        log_file = session_file.with_name(f"{session_file.stem}.log.ndjson")
+                        if log_file.exists():
+                            log_file.unlink()
                         cleaned_count += 1
                         self.logger.debug(f"오래된 세션 삭제: {session_file.name}")
                         
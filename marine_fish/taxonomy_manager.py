@@ -3,30 +3,271 @@ Taxonomic data management system for marine fish classification
 Complete database of marine ornamental fish species
 """
 
+import copy
+import hashlib
 import json
+import os
+import pickle
+import re
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Any
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import lru_cache
+from importlib import resources
 from .logger import get_logger
 from .error_handler import get_error_handler, handle_gracefully
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
-@dataclass
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치 시 정규식 매처 사용
+    ahocorasick = None
+
+# TaxonomyManager.save() 스냅샷 형식 버전 (구조 변경 시 증가)
+_SNAPSHOT_VERSION = 2
+
+# search_by_common_name 결과 캐시 최대 항목 수
+_SEARCH_CACHE_SIZE = 1024
+
+# 완전한 분류학적 계층구조 데이터 디렉토리 (현재 유통되는 모든 관상용 해수어)
+# 강(class)마다 "<강 이름>.json" 파일 하나
+# (zip 등으로 배포돼도 읽을 수 있도록 importlib.resources로 접근)
+_TAXONOMY_DATA_DIR = resources.files(__package__) / "data" / "taxonomy"
+
+# TaxonomyManager.from_cache()에 cache_dir를 주지 않았을 때 캐시 디렉토리를 지정하는 환경 변수
+# (둘 다 없으면 캐시를 사용하지 않음)
+_CACHE_DIR_ENV = "MARINE_FISH_TAXONOMY_CACHE"
+
+# 흔히 쓰이는 속명 오기 -> 정식 속명 (로드 시 병합, 조회 시 정식 속명으로 변환)
+_GENUS_ALIASES = {"Cirrihilabrus": "Cirrhilabrus"}
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """numpy 지연 import (모듈 import 시간의 대부분을 차지하므로 첫 사용 시 로드)
+
+    미설치 시 None을 반환하며, 호출 측은 평면 배열을 파이썬 루프로 처리한다.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _taxonomy_data_files() -> Dict[str, Any]:
+    """강 이름 -> 데이터 파일(Traversable), 강 이름 순"""
+    return {
+        entry.name[: -len(".json")]: entry
+        for entry in sorted(_TAXONOMY_DATA_DIR.iterdir(), key=lambda e: e.name)
+        if entry.name.endswith(".json")
+    }
+
+
+def _find_duplicate_keys(data: bytes) -> List[str]:
+    """JSON 문서에서 같은 객체 안에 중복된 키 목록 반환
+
+    일반 파싱은 마지막 값만 남기고 조용히 덮어쓰므로 별도로 검사한다.
+    """
+    duplicates: List[str] = []
+
+    def collect(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        seen = set()
+        for key, _ in pairs:
+            if key in seen:
+                duplicates.append(key)
+            seen.add(key)
+        return dict(pairs)
+
+    json.loads(data, object_pairs_hook=collect)
+    return duplicates
+
+
+def _order_from_path(path: Sequence[str]) -> str:
+    """과까지의 상위 경로에서 목(order) 이름 결정
+
+    'formes' 또는 'ales'로 끝나는 가장 가까운 계급을 목으로 보고,
+    없으면 바로 위 계급을 목으로 간주한다.
+    """
+    for rank in reversed(path):
+        if rank.endswith(("formes", "ales")):
+            return rank
+    return path[-1] if path else "Unknown"
+
+
+def _resolve_ranks(path: Sequence[str]) -> Optional[Tuple[str, str, str, str]]:
+    """종 일반명 목록까지의 경로에서 (class, order, family, genus) 추출
+
+    path는 최상위 강(class)부터 종명까지의 키 목록이다.
+    인덱스 대상이 아닌 경로이면 None을 반환한다.
+    """
+    if len(path) < 5:
+        return None
+
+    class_name, genus_name = path[0], path[-2]
+    if class_name == "Chondrichthyes":
+        # 강 > 목 > 과 > 속 > 종 고정 구조
+        if len(path) != 5:
+            return None
+        return class_name, path[1], path[2], genus_name
+
+    if class_name == "Osteichthyes" and path[1] == "Actinopterygii":
+        # 속 위로는 아과('inae')만 올 수 있고, 그 위가 과('idae')
+        levels = path[2:-2]
+        family_pos = len(levels) - 1
+        while family_pos >= 0 and levels[family_pos].endswith("inae"):
+            family_pos -= 1
+        if family_pos < 0 or not levels[family_pos].endswith("idae"):
+            return None
+
+        order_name = _order_from_path(levels[:family_pos])
+        return class_name, order_name, levels[family_pos], genus_name
+
+    return None
+
+
+def _iter_flat(
+    taxonomy: Mapping[str, Any]
+) -> Iterator[Tuple[str, str, str, str, str, Sequence[str]]]:
+    """분류 트리를 순회하며 (class, order, family, genus, species, 일반명) 생성
+
+    계층 깊이가 강마다 달라도 _resolve_ranks로 계급을 판별하므로,
+    인덱스 생성 쪽은 평면 루프 하나로 처리할 수 있다.
+    """
+    def walk(node: Mapping[str, Any], path: Tuple[str, ...]):
+        for key, value in node.items():
+            if isinstance(value, dict):
+                yield from walk(value, path + (key,))
+            elif isinstance(value, (list, tuple)):
+                ranks = _resolve_ranks(path + (key,))
+                if ranks is not None:
+                    yield (*ranks, key, value)
+
+    return walk(taxonomy, ())
+
+
+def _compact_name_key(key: str) -> str:
+    """일반명 검색 키에서 모든 공백 제거"""
+    return "".join(key.split())
+
+
+def _canonical_name(name: str, canon: Dict[str, str]) -> str:
+    """일반명을 NFC로 정규화하고 같은 값은 하나의 문자열 객체로 통합"""
+    if not name.isascii():
+        name = unicodedata.normalize("NFC", name)
+    return canon.setdefault(name, name)
+
+
+def _intern_taxonomy(
+    node: Mapping[str, Any], canon: Dict[Any, Any], leaf_type: type = list
+) -> Dict[str, Any]:
+    """분류 트리의 키를 intern 하고 같은 일반명은 하나의 문자열 객체로 통합
+
+    canon은 일반명 정규화용 사전으로, 한 번의 로드 동안 공유한다.
+    leaf_type=tuple 이면 일반명 목록을 불변 튜플로 저장하고,
+    내용이 같은 튜플은 하나의 객체를 공유한다.
+    한글 등 비 ASCII 일반명은 NFC로 정규화해 저장한다 (분해형 한글 입력 대비).
+    """
+    result: Dict[str, Any] = {}
+    for key, value in node.items():
+        if isinstance(value, dict):
+            value = _intern_taxonomy(value, canon, leaf_type)
+        elif isinstance(value, list):
+            value = leaf_type(
+                _canonical_name(name, canon) if isinstance(name, str) else name
+                for name in value
+            )
+            if leaf_type is tuple:
+                value = canon.setdefault(value, value)
+        result[sys.intern(key)] = value
+    return result
+
+
+def _freeze_index(index: Mapping[Any, List[Any]]) -> Mapping[Any, Tuple[Any, ...]]:
+    """리스트 값 인덱스를 튜플 값의 읽기 전용 매핑으로 변환
+
+    dict.fromkeys(dict)는 원본 크기만큼 미리 할당하므로,
+    이후 기존 키에 값을 대입하는 동안 재할당(rehash)이 일어나지 않는다.
+    """
+    frozen = dict.fromkeys(index)
+    for key, entries in index.items():
+        frozen[key] = tuple(entries)
+    return MappingProxyType(frozen)
+
+
+def _common_name_key(common_name: str) -> str:
+    """일반명 검색 키 생성 (NFKC 정규화 후 casefold)"""
+    if common_name.isascii():
+        # ASCII 문자열은 NFKC 정규화 결과가 자기 자신이므로 생략
+        return common_name.casefold()
+    return unicodedata.normalize("NFKC", common_name).casefold()
+
+
+# 단어 경계 판정에 쓰는 문자 (본문과 일반명 키는 모두 소문자로 정규화된 상태)
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+def _on_word_boundary(text: str, start: int, end: int) -> bool:
+    """text[start:end] 일치가 단어 경계에 놓였는지 확인
+
+    영문/숫자로 시작하거나 끝나는 이름만 앞뒤 문자를 검사하므로
+    조사가 붙는 한글 이름("블루탱을")은 그대로 일치로 본다.
+    """
+    if start > 0 and text[start] in _WORD_CHARS and text[start - 1] in _WORD_CHARS:
+        return False
+    if end < len(text) and text[end - 1] in _WORD_CHARS and text[end] in _WORD_CHARS:
+        return False
+    return True
+
+
+def _bounded_pattern(key: str) -> str:
+    """_on_word_boundary와 같은 경계 조건을 붙인 일반명 정규식"""
+    pattern = re.escape(key)
+    if key[0] in _WORD_CHARS:
+        pattern = "(?<![a-z0-9])" + pattern
+    if key[-1] in _WORD_CHARS:
+        pattern += "(?![a-z0-9])"
+    return pattern
+
+
+@dataclass(slots=True, frozen=True)
 class SpeciesInfo:
     """종 정보 클래스"""
 
     genus: str
     species: str
-    common_names: List[str]
+    # 목록은 해시 불가하므로 해시 계산에서 제외 (학명·계급으로 충분히 구분됨)
+    common_names: List[str] = field(hash=False)
     family: str
     order: str
     class_name: str
+    _scientific_name: str = field(init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """학명을 한 번만 생성해 보관"""
+        object.__setattr__(
+            self, "_scientific_name", sys.intern(self.genus + " " + self.species)
+        )
 
     @property
     def scientific_name(self) -> str:
         """학명 반환"""
-        return f"{self.genus} {self.species}"
+        return self._scientific_name
 
     @property
     def primary_common_name(self) -> str:
@@ -37,3399 +278,56 @@ class SpeciesInfo:
             else self.scientific_name
         )
 
+    def _as_dict(self) -> Dict[str, Any]:
+        """캐시된 딕셔너리 반환 (불변 객체이므로 최초 1회만 생성, 내부 전용)"""
+        if self._dict_cache is None:
+            object.__setattr__(
+                self,
+                "_dict_cache",
+                {
+                    "genus": self.genus,
+                    "species": self.species,
+                    "common_names": self.common_names,
+                    "family": self.family,
+                    "order": self.order,
+                    "class": self.class_name,
+                },
+            )
+        return self._dict_cache
+
     def to_dict(self) -> Dict[str, Any]:
-        """딕셔너리로 변환"""
-        return {
-            "genus": self.genus,
-            "species": self.species,
-            "common_names": self.common_names,
-            "family": self.family,
-            "order": self.order,
-            "class": self.class_name,
-        }
+        """딕셔너리로 변환 (호출자가 수정할 수 있도록 캐시의 복사본 반환)"""
+        return dict(self._as_dict())
+
+    def to_json_bytes(self) -> bytes:
+        """to_dict() 결과를 UTF-8 JSON 바이트로 직렬화"""
+        if orjson is not None:
+            return orjson.dumps(self._as_dict())
+        return json.dumps(self._as_dict(), ensure_ascii=False).encode("utf-8")
 
 
 class TaxonomyManager:
     """분류학적 데이터 관리자"""
 
-    def __init__(self, taxonomy_file: Optional[str] = None):
+    # 강별 기본 분류 체계 (처음 요청될 때 로드하여 모든 인스턴스가 공유, 직접 수정 금지)
+    _CLASS_TAXONOMY_CACHE: Dict[str, Dict[str, Any]] = {}
+
+    # fish_taxonomy가 공유 캐시를 참조하는지 여부 (병합 전 복사 필요)
+    _taxonomy_shared = False
+
+    def __init__(
+        self,
+        taxonomy_file: Optional[str] = None,
+        classes: Optional[Sequence[str]] = None,
+    ):
+        """classes를 지정하면 해당 강(예: "Osteichthyes")의 데이터만 로드"""
         self.logger = get_logger("taxonomy_manager")
         self.error_handler = get_error_handler()
 
-        # 완전한 분류학적 계층구조 (현재 유통되는 모든 관상용 해수어)
-        self.fish_taxonomy = {
-            "Chondrichthyes": {  # 연골어강
-                "Carcharhiniformes": {  # 흉상어목
-                    "Hemiscylliidae": {  # 대나무상어과
-                        "Chiloscyllium": {
-                            "punctatum": [
-                                "Brownbanded bamboo shark",
-                                "갈색줄무늬 대나무상어",
-                            ],
-                            "plagiosum": [
-                                "Whitespotted bamboo shark",
-                                "흰점 대나무상어",
-                            ],
-                            "griseum": ["Grey bamboo shark", "회색 대나무상어"],
-                            "hasselti": [
-                                "Hasselt's bamboo shark",
-                                "하셀트 대나무상어",
-                            ],
-                            "arabicum": [
-                                "Arabian bamboo shark",
-                                "아라비안 대나무상어",
-                            ],
-                            "burmensis": [
-                                "Burmese bamboo shark",
-                                "버마 대나무상어",
-                            ],
-                        },
-                        "Hemiscyllium": {
-                            "ocellatum": [
-                                "Epaulette shark",
-                                "견장상어",
-                                "Walking shark",
-                            ],
-                            "freycineti": [
-                                "Indonesian walking shark",
-                                "인도네시아 견장상어",
-                            ],
-                            "hallstromi": [
-                                "Papuan epaulette shark",
-                                "파푸아 견장상어",
-                            ],
-                            "henryi": [
-                                "Henry's epaulette shark",
-                                "헨리 견장상어",
-                            ],
-                            "strahani": [
-                                "Hooded carpet shark",
-                                "후드 카펫상어",
-                            ],
-                            "trispeculare": [
-                                "Speckled carpet shark",
-                                "스펙클드 카펫상어",
-                            ],
-                        },
-                    },
-                    "Scyliorhinidae": {  # 고양이상어과
-                        "Atelomycterus": {
-                            "marmoratus": [
-                                "Coral catshark",
-                                "Marbled catshark",
-                                "마블 캣샤크",
-                            ],
-                            "macleayi": [
-                                "Australian marbled catshark",
-                                "오스트레일리안 마블 캣샤크",
-                            ],
-                        },
-                        "Halaelurus": {
-                            "natalensis": [
-                                "Tiger catshark",
-                                "타이거 캣샤크",
-                            ],
-                        },
-                        "Scyliorhinus": {
-                            "retifer": [
-                                "Chain catshark",
-                                "체인 캣샤크",
-                            ],
-                            "torazame": [
-                                "Cloudy catshark",
-                                "클라우디 캣샤크",
-                            ],
-                        },
-                    },
-                    "Ginglymostomatidae": {  # 간호상어과
-                        "Ginglymostoma": {
-                            "cirratum": [
-                                "Nurse shark",
-                                "간호상어",
-                            ],
-                        },
-                        "Nebrius": {
-                            "ferrugineus": [
-                                "Tawny nurse shark",
-                                "토니 간호상어",
-                            ],
-                        },
-                    },
-                },
-                "Rajiformes": {  # 가오리목
-                    "Dasyatidae": {  # 참가오리과
-                        "Taeniura": {
-                            "lymma": [
-                                "Blue-spotted stingray",
-                                "Bluespotted ribbontail ray",
-                                "블루스팟가오리",
-                            ],
-                            "grabata": [
-                                "Round ribbontail ray",
-                                "라운드 리본테일 가오리",
-                            ],
-                        },
-                        "Dasyatis": {
-                            "pastinaca": [
-                                "Common stingray",
-                                "커먼 스팅레이",
-                            ],
-                            "americana": [
-                                "Southern stingray",
-                                "서던 스팅레이",
-                            ],
-                        },
-                        "Himantura": {
-                            "uarnak": [
-                                "Honeycomb stingray",
-                                "허니콤 스팅레이",
-                            ],
-                            "gerrardi": [
-                                "Sharpnose stingray",
-                                "샤프노즈 스팅레이",
-                            ],
-                        },
-                    },
-                    "Rhinobatidae": {  # 기타가오리과
-                        "Rhinobatos": {
-                            "productus": [
-                                "Shovelnose guitarfish",
-                                "쇼블노즈 기타피쉬",
-                            ],
-                        },
-                    },
-                    "Torpedinidae": {  # 전기가오리과
-                        "Torpedo": {
-                            "marmorata": [
-                                "Marbled electric ray",
-                                "마블 일렉트릭 레이",
-                            ],
-                        },
-                    },
-                },
-            },
-            "Osteichthyes": {  # 경골어강
-                "Actinopterygii": {  # 조기어강
-                    "Acanthuromorpha": {  # 가시기상목
-                        "Acanthuriformes": {  # 가시기목
-                            "Acanthuridae": {  # 쥐치과 (탱류)
-                                "Paracanthurus": {
-                                    "hepatus": [
-                                        "Blue tang",
-                                        "Regal tang",
-                                        "Palette surgeonfish",
-                                        "Hippo tang",
-                                        "Dory fish",
-                                        "파란탱",
-                                        "리갈탱",
-                                    ]
-                                },
-                                "Zebrasoma": {
-                                    "flavescens": [
-                                        "Yellow tang",
-                                        "Lemon sailfin",
-                                        "옐로우탱",
-                                        "노란탱",
-                                    ],
-                                    "xanthurum": [
-                                        "Purple tang",
-                                        "Yellowtail surgeonfish",
-                                        "퍼플탱",
-                                        "보라탱",
-                                    ],
-                                    "veliferum": [
-                                        "Sailfin tang",
-                                        "Pacific sailfin tang",
-                                        "세일핀탱",
-                                    ],
-                                    "desjardinii": [
-                                        "Red Sea sailfin tang",
-                                        "Desjardin's sailfin tang",
-                                        "데자르딘 세일핀탱",
-                                    ],
-                                    "scopas": [
-                                        "Brown tang",
-                                        "Twotone tang",
-                                        "브라운탱",
-                                    ],
-                                    "gemmatum": ["Spotted tang", "스팟티드탱"],
-                                    "rostratum": [
-                                        "Longnose surgeonfish",
-                                        "롱노즈탱",
-                                    ],
-                                    "xanthurus": [
-                                        "Purple tang",
-                                        "Yellowtail tang",
-                                        "옐로우테일탱",
-                                    ],
-                                },
-                                "Acanthurus": {
-                                    "leucosternon": [
-                                        "Powder blue tang",
-                                        "Powder blue surgeonfish",
-                                        "파우더블루탱",
-                                    ],
-                                    "japonicus": [
-                                        "White-faced surgeonfish",
-                                        "Gold rim tang",
-                                        "골드림탱",
-                                    ],
-                                    "sohal": [
-                                        "Sohal surgeonfish",
-                                        "Sohal tang",
-                                        "소할탱",
-                                    ],
-                                    "lineatus": [
-                                        "Lined surgeonfish",
-                                        "Blue-lined surgeonfish",
-                                        "라인드탱",
-                                    ],
-                                    "achilles": [
-                                        "Achilles tang",
-                                        "Red-spotted surgeonfish",
-                                        "아킬레스탱",
-                                    ],
-                                    "nigrofuscus": [
-                                        "Brown surgeonfish",
-                                        "Lavender tang",
-                                        "라벤더탱",
-                                    ],
-                                    "pyroferus": [
-                                        "Chocolate surgeonfish",
-                                        "초콜릿탱",
-                                    ],
-                                    "tennentii": [
-                                        "Lieutenant tang",
-                                        "리우테넌트탱",
-                                    ],
-                                    "tristis": [
-                                        "Indian Ocean mimic surgeonfish",
-                                        "인디언오션미믹탱",
-                                    ],
-                                    "coeruleus": [
-                                        "Blue tang surgeonfish",
-                                        "블루탱서전피쉬",
-                                    ],
-                                    "bahianus": [
-                                        "Ocean surgeonfish",
-                                        "오션서전피쉬",
-                                    ],
-                                    "chirurgus": ["Doctorfish", "닥터피쉬"],
-                                    "olivaceus": [
-                                        "Orange-shoulder surgeonfish",
-                                        "오렌지숄더탱",
-                                    ],
-                                    "mata": [
-                                        "Elongate surgeonfish",
-                                        "일롱게이트탱",
-                                    ],
-                                    "fowleri": [
-                                        "Fowler's surgeonfish",
-                                        "파울러탱",
-                                    ],
-                                    "dussumieri": [
-                                        "Eyestripe surgeonfish",
-                                        "아이스트라이프탱",
-                                    ],
-                                    "bariene": [
-                                        "Black-spot surgeonfish",
-                                        "블랙스팟탱",
-                                    ],
-                                    "blochii": [
-                                        "Ringtail surgeonfish",
-                                        "링테일탱",
-                                    ],
-                                    "chronixis": [
-                                        "Chronixis surgeonfish",
-                                        "크로닉시스탱",
-                                    ],
-                                    "guttatus": [
-                                        "Whitespotted surgeonfish",
-                                        "화이트스팟탱",
-                                    ],
-                                    "maculiceps": [
-                                        "White-freckled surgeonfish",
-                                        "화이트프레클드탱",
-                                    ],
-                                    "nigricans": [
-                                        "Whitecheek surgeonfish",
-                                        "화이트치크탱",
-                                    ],
-                                    "nigricauda": [
-                                        "Epaulette surgeonfish",
-                                        "에폴렛탱",
-                                    ],
-                                    "nubilus": [
-                                        "Bluelined surgeonfish",
-                                        "블루라인드탱",
-                                    ],
-                                    "reversus": [
-                                        "Reversed surgeonfish",
-                                        "리버스드탱",
-                                    ],
-                                    "sandvicensis": [
-                                        "Thompson's surgeonfish",
-                                        "톰슨탱",
-                                    ],
-                                    "thompsoni": [
-                                        "Thompson's surgeonfish",
-                                        "톰슨서전피쉬",
-                                    ],
-                                    "triostegus": [
-                                        "Convict surgeonfish",
-                                        "컨빅트탱",
-                                    ],
-                                    "xanthopterus": [
-                                        "Yellowfin surgeonfish",
-                                        "옐로우핀탱",
-                                    ],
-                                },
-                                "Naso": {
-                                    "lituratus": [
-                                        "Orangespine unicornfish",
-                                        "Naso tang",
-                                        "나소탱",
-                                    ],
-                                    "elegans": [
-                                        "Elegant unicornfish",
-                                        "엘레간트 유니콘피쉬",
-                                    ],
-                                    "lopezi": [
-                                        "Lopez's unicornfish",
-                                        "로페즈 유니콘피쉬",
-                                    ],
-                                    "vlamingi": [
-                                        "Vlaming's unicornfish",
-                                        "블라밍기탱",
-                                        "블라밍 유니콘피쉬",
-                                    ],
-                                    "unicornis": [
-                                        "Bluespine unicornfish",
-                                        "블루스파인 유니콘피쉬",
-                                    ],
-                                    "brevirostris": [
-                                        "Spotted unicornfish",
-                                        "스팟티드 유니콘피쉬",
-                                    ],
-                                    "annulatus": [
-                                        "Whitemargin unicornfish",
-                                        "화이트마진 유니콘피쉬",
-                                    ],
-                                    "caesius": [
-                                        "Gray unicornfish",
-                                        "그레이 유니콘피쉬",
-                                    ],
-                                    "hexacanthus": [
-                                        "Sleek unicornfish",
-                                        "슬릭 유니콘피쉬",
-                                    ],
-                                    "minor": [
-                                        "Blackspine unicornfish",
-                                        "블랙스파인 유니콘피쉬",
-                                    ],
-                                    "reticulatus": [
-                                        "Reticulated unicornfish",
-                                        "레티큘레이티드 유니콘피쉬",
-                                    ],
-                                    "thynnoides": [
-                                        "Oneknife unicornfish",
-                                        "원나이프 유니콘피쉬",
-                                    ],
-                                },
-                                "Ctenochaetus": {
-                                    "strigosus": [
-                                        "Kole tang",
-                                        "Yellow-eyed surgeonfish",
-                                        "콜탱",
-                                    ],
-                                    "hawaiiensis": [
-                                        "Chevron tang",
-                                        "쉐브론탱",
-                                    ],
-                                    "tominiensis": ["Tomini tang", "토미니탱"],
-                                    "binotatus": [
-                                        "Two-spot bristletooth",
-                                        "투스팟브리슬투스",
-                                    ],
-                                    "cyanocheilus": [
-                                        "Bluelip bristletooth",
-                                        "블루립브리슬투스",
-                                    ],
-                                    "marginatus": [
-                                        "Blue-spotted bristletooth",
-                                        "블루스팟브리슬투스",
-                                    ],
-                                    "striatus": [
-                                        "Striated surgeonfish",
-                                        "스트라이에이티드브리슬투스",
-                                    ],
-                                    "truncatus": [
-                                        "Indian gold-ring bristletooth",
-                                        "인디언골드링브리슬투스",
-                                    ],
-                                    "flavicauda": [
-                                        "Yellowtail bristletooth",
-                                        "옐로우테일브리슬투스",
-                                    ],
-                                },
-                                "Prionurus": {
-                                    "laticlavius": [
-                                        "Yellowtail surgeonfish",
-                                        "옐로우테일서전피쉬",
-                                    ],
-                                    "punctatus": [
-                                        "Yellowtail surgeonfish",
-                                        "옐로우테일서전피쉬",
-                                    ],
-                                    "scalprum": [
-                                        "Scalpel sawtail",
-                                        "스칼펠소테일",
-                                    ],
-                                },
-                            },
-                            "Siganidae": {  # 래빗피쉬과 (토끼물고기류)
-                                "Siganus": {
-                                    "vulpinus": [
-                                        "Foxface rabbitfish",
-                                        "Vulpine rabbitfish",
-                                        "복숭아 토끼피쉬",
-                                    ],
-                                    "unimaculatus": [
-                                        "Blotched foxface",
-                                        "One-spot foxface",
-                                        "블로치드 폭스페이스",
-                                    ],
-                                    "puellus": [
-                                        "Masked rabbitfish",
-                                        "Masked spinefoot",
-                                        "마스크드 래빗피쉬",
-                                    ],
-                                    "corallinus": [
-                                        "Twospot rabbitfish",
-                                        "코랄린러스 래빗피쉬",
-                                    ],
-                                    # ===== 추가 확장 종 (Foxface / Rabbitfish 다양화)
-                                    # 목록은 대표적 사육/유통 종 위주 =====
-                                    "magnificus": [
-                                        "Magnificent foxface",
-                                        "매그니피센트폭스페이스",
-                                    ],
-                                    "doliatus": [
-                                        "Barred spinefoot",
-                                        "Blue-lined rabbitfish",
-                                        "바드스파인풋",
-                                        "블루라인래빗피쉬",
-                                    ],
-                                    "virgatus": [
-                                        "Two-barred rabbitfish",
-                                        "투바랏래빗피쉬",
-                                    ],
-                                    "uspi": [
-                                        "Bicolor foxface",
-                                        "바이컬러폭스페이스",
-                                    ],
-                                    "guttatus": [
-                                        "Golden rabbitfish",
-                                        "골든래빗피쉬",
-                                    ],
-                                    "lineatus": [
-                                        "Lined rabbitfish",
-                                        "라인드래빗피쉬",
-                                    ],
-                                    "canaliculatus": [
-                                        "White-spotted spinefoot",
-                                        "화이트스팟스파인풋",
-                                    ],
-                                    "stellatus": [
-                                        "Starry rabbitfish",
-                                        "스타리래빗피쉬",
-                                    ],
-                                    "argenteus": [
-                                        "Streamlined spinefoot",
-                                        "스트림라인드스파인풋",
-                                    ],
-                                }
-                            },
-                            "Pomacanthidae": {  # 엔젤피쉬과
-                                "Centropyge": {
-                                    "bicolor": [
-                                        "Bicolor angelfish",
-                                        "Two-colored angelfish",
-                                        "바이컬러엔젤",
-                                    ],
-                                    "loricula": [
-                                        "Flame angelfish",
-                                        "Flame angel",
-                                        "플레임엔젤",
-                                        "플레임",
-                                    ],
-                                    "argi": [
-                                        "Cherub angelfish",
-                                        "Pygmy angelfish",
-                                        "체럽엔젤",
-                                    ],
-                                    "eibli": [
-                                        "Eibli angelfish",
-                                        "Red stripe angelfish",
-                                        "아이블리엔젤",
-                                    ],
-                                    "bispinosa": [
-                                        "Coral beauty",
-                                        "Two-spined angelfish",
-                                        "코랄뷰티",
-                                        "코랄뷰티엔젤",
-                                    ],
-                                    "fisheri": [
-                                        "Fisher's angelfish",
-                                        "피셔엔젤",
-                                    ],
-                                    "flavissima": [
-                                        "Lemonpeel angelfish",
-                                        "레몬필엔젤",
-                                    ],
-                                    "heraldi": [
-                                        "Herald's angelfish",
-                                        "헤럴드엔젤",
-                                    ],
-                                    "interruptus": [
-                                        "Japanese angelfish",
-                                        "재패니즈엔젤",
-                                    ],
-                                    "multicolor": [
-                                        "Multicolor angelfish",
-                                        "멀티컬러엔젤",
-                                    ],
-                                    "nox": ["Midnight angelfish", "미드나잇엔젤"],
-                                    "potteri": [
-                                        "Potter's angelfish",
-                                        "포터엔젤",
-                                    ],
-                                    "resplendens": [
-                                        "Resplendent angelfish",
-                                        "레스플렌던트엔젤",
-                                    ],
-                                    "tibicen": [
-                                        "Keyhole angelfish",
-                                        "키홀엔젤",
-                                    ],
-                                    "vrolikii": [
-                                        "Pearlscale angelfish",
-                                        "Half-black angelfish",
-                                        "펄스케일엔젤",
-                                        "하프블랙엔젤",
-                                    ],
-                                    "acanthops": [
-                                        "African flameback angelfish",
-                                        "아프리칸플레임백엔젤",
-                                    ],
-                                    "aurantonotus": [
-                                        "Flameback angelfish",
-                                        "플레임백엔젤",
-                                    ],
-
-                                    "colini": [
-                                        "Colin's angelfish",
-                                        "콜린엔젤",
-                                    ],
-                                    "debelius": [
-                                        "Debelius angelfish",
-                                        "데벨리우스엔젤",
-                                    ],
-                                    "ferrugata": [
-                                        "Rusty angelfish",
-                                        "러스티엔젤",
-                                    ],
-                                    "hotumatua": [
-                                        "Easter Island angelfish",
-                                        "이스터아일랜드엔젤",
-                                    ],
-                                    "joculator": [
-                                        "Yellowface angelfish",
-                                        "옐로우페이스엔젤",
-                                    ],
-
-                                    "nahackyi": [
-                                        "Nahacky's angelfish",
-                                        "나하키엔젤",
-                                    ],
-                                    "narcosis": [
-                                        "Narc angelfish",
-                                        "나크엔젤",
-                                    ],
-                                    "shepardi": [
-                                        "Shepard's angelfish",
-                                        "셰파드엔젤",
-                                    ],
-                                    "venusta": [
-                                        "Purple-masked angelfish",
-                                        "퍼플마스크드엔젤",
-                                    ],
-                                    "boylei": [
-                                        "Peppermint angelfish",
-                                        "페퍼민트엔젤",
-                                    ],
-                                    "multibarbus": [
-                                        "Multibar angelfish",
-                                        "멀티바엔젤",
-                                    ],
-                                    "multispinis": [
-                                        "Dusky angelfish",
-                                        "더스키엔젤",
-                                    ],
-                                    "nigriocellus": [
-                                        "Blackspot angelfish",
-                                        "블랙스팟엔젤",
-                                    ],
-                                    "woodheadi": [
-                                        "Woodhead's angelfish",
-                                        "우드헤드엔젤",
-                                    ],
-                                    "abei": [
-                                        "Abe's angelfish",
-                                        "아베엔젤",
-                                    ],
-                                    "aurantia": [
-                                        "Golden angelfish",
-                                        "골든엔젤",
-                                    ],
-                                },
-                                "Pomacanthus": {
-                                    "imperator": [
-                                        "Emperor angelfish",
-                                        "Imperial angelfish",
-                                        "엠페러엔젤",
-                                    ],
-                                    "semicirculatus": [
-                                        "Koran angelfish",
-                                        "Semicircle angelfish",
-                                        "코란엔젤",
-                                    ],
-                                    "navarchus": [
-                                        "Blue-girdled angelfish",
-                                        "Majestic angelfish",
-                                        "마제스틱엔젤",
-                                    ],
-                                    "annularis": [
-                                        "Blue-ring angelfish",
-                                        "블루링엔젤",
-                                    ],
-                                    "asfur": [
-                                        "Arabian angelfish",
-                                        "아라비안엔젤",
-                                    ],
-                                    "chrysurus": [
-                                        "Goldtail angelfish",
-                                        "골드테일엔젤",
-                                    ],
-                                    "maculosus": [
-                                        "Yellowbar angelfish",
-                                        "옐로우바엔젤",
-                                    ],
-                                    "paru": [
-                                        "French angelfish",
-                                        "프렌치엔젤",
-                                    ],
-                                    "sexstriatus": [
-                                        "Six-banded angelfish",
-                                        "식스밴드엔젤",
-                                    ],
-                                    "xanthometopon": [
-                                        "Blueface angelfish",
-                                        "블루페이스엔젤",
-                                    ],
-                                    "zonipectus": [
-                                        "Cortez angelfish",
-                                        "코테즈엔젤",
-                                    ],
-                                    "arcuatus": [
-                                        "Gray angelfish",
-                                        "그레이엔젤",
-                                    ],
-
-                                    "altus": [
-                                        "Deep angelfish",
-                                        "딥엔젤",
-                                    ],
-                                    "griffithsi": [
-                                        "Griffith's angelfish",
-                                        "그리피스엔젤",
-                                    ],
-                                    # rhomboides 항목 중복 제거 (위 정의 삭제)
-                                    "griseus": [
-                                        "Gray angelfish",
-                                        "그레이포마엔젤",
-                                    ],
-                                    "personifer": [
-                                        "Personifer angelfish",
-                                        "퍼소나이퍼엔젤",
-                                    ],
-
-                                },
-                                "Holacanthus": {
-                                    "ciliaris": [
-                                        "Queen angelfish",
-                                        "퀸엔젤",
-                                    ],
-                                    "tricolor": [
-                                        "Rock beauty",
-                                        "록뷰티",
-                                    ],
-                                    "bermudensis": [
-                                        "Blue angelfish",
-                                        "블루엔젤",
-                                    ],
-                                    "passer": [
-                                        "King angelfish",
-                                        "킹엔젤",
-                                    ],
-                                    "clarionensis": [
-                                        "Clarion angelfish",
-                                        "클라리온엔젤",
-                                    ],
-                                    "limbatus": [
-                                        "Clipperton angelfish",
-                                        "클리퍼톤엔젤",
-                                    ],
-                                },
-                                "Genicanthus": {
-                                    "lamarck": [
-                                        "Lamarck's angelfish",
-                                        "라마크엔젤",
-                                    ],
-                                    "melanospilos": [
-                                        "Blackspot angelfish",
-                                        "블랙스팟엔젤",
-                                    ],
-                                    "semifasciatus": [
-                                        "Japanese swallow",
-                                        "재패니즈스왈로우",
-                                    ],
-                                    "watanabei": [
-                                        "Watanabe's angelfish",
-                                        "와타나베엔젤",
-                                    ],
-                                    "bellus": [
-                                        "Ornate angelfish",
-                                        "오네이트엔젤",
-                                    ],
-                                    "caudovittatus": [
-                                        "Zebra angelfish",
-                                        "제브라엔젤",
-                                    ],
-                                    "personatus": [
-                                        "Masked angelfish",
-                                        "마스크드엔젤",
-                                    ],
-                                    "takeuchii": [
-                                        "Takeuchi's angelfish",
-                                        "타케우치엔젤",
-                                    ],
-                                },
-                                "Apolemichthys": {
-                                    "trimaculatus": [
-                                        "Three-spot angelfish",
-                                        "쓰리스팟엔젤",
-                                    ],
-                                    "xanthotis": [
-                                        "Indian yellowtail angelfish",
-                                        "인디언옐로우테일엔젤",
-                                    ],
-                                    "arcuatus": [
-                                        "Banded angelfish",
-                                        "밴디드엔젤",
-                                    ],
-                                    "griffisi": [
-                                        "Griffis angelfish",
-                                        "그리피스엔젤",
-                                    ],
-                                    "kingi": [
-                                        "Tiger angelfish",
-                                        "타이거엔젤",
-                                    ],
-                                    "xanthurus": [
-                                        "Indian smoke angelfish",
-                                        "인디언스모크엔젤",
-                                    ],
-                                },
-                                "Pygoplites": {
-                                    "diacanthus": [
-                                        "Regal angelfish",
-                                        "Royal angelfish",
-                                        "리갈엔젤",
-                                    ],
-                                },
-                                "Chaetodontoplus": {
-                                    "septentrionalis": [
-                                        "Blue-striped angelfish",
-                                        "블루스트라이프엔젤",
-                                    ],
-                                    "mesoleucus": [
-                                        "Vermiculated angelfish",
-                                        "버미큘레이티드엔젤",
-                                    ],
-                                    "melanosoma": [
-                                        "Black-velvet angelfish",
-                                        "블랙벨벳엔젤",
-                                    ],
-                                    "duboulayi": [
-                                        "Scribbled angelfish",
-                                        "스크리블드엔젤",
-                                    ],
-                                    "chrysocephalus": [
-                                        "Orangeface angelfish",
-                                        "오렌지페이스엔젤",
-                                    ],
-                                    "caeruleopunctatus": [
-                                        "Blue-spotted angelfish",
-                                        "블루스팟엔젤",
-                                    ],
-                                    "conspicillatus": [
-                                        "Conspicuous angelfish",
-                                        "컨스피큐어스엔젤",
-                                        "컨스피큘러스엔젤",
-                                    ],
-                                },
-                            },
-                            "Pomacentridae": {  # 자리돔과
-                                "Amphiprioninae": {  # 흰동가리아과 (클라운피쉬)
-                                    "Amphiprion": {
-                                        "ocellaris": [
-                                            "Ocellaris clownfish",
-                                            "False percula clownfish",
-                                            "Common clownfish",
-                                            "오셀라리스",
-                                            "니모",
-                                        ],
-                                        "percula": [
-                                            "Orange clownfish",
-                                            "Percula clownfish",
-                                            "True percula",
-                                            "퍼큘라",
-                                            "트루퍼큘라",
-                                        ],
-                                        "clarkii": [
-                                            "Clark's anemonefish",
-                                            "Yellowtail clownfish",
-                                            "클라키",
-                                        ],
-                                        "frenatus": [
-                                            "Tomato clownfish",
-                                            "Red clownfish",
-                                            "토마토클라운",
-                                        ],
-                                        "melanopus": [
-                                            "Red and black anemonefish",
-                                            "Fire clownfish",
-                                            "파이어클라운",
-                                        ],
-                                        "polymnus": [
-                                            "Saddleback clownfish",
-                                            "White-bonnet anemonefish",
-                                            "새들백클라운",
-                                        ],
-                                        "sebae": ["Sebae clownfish", "세바에클라운"],
-                                        "ephippium": [
-                                            "Red saddleback anemonefish",
-                                            "레드새들백",
-                                        ],
-                                        "chrysopterus": [
-                                            "Orange-fin anemonefish",
-                                            "오렌지핀클라운",
-                                        ],
-                                        "bicinctus": [
-                                            "Two-band anemonefish",
-                                            "투밴드클라운",
-                                        ],
-                                        "akallopisos": [
-                                            "Skunk clownfish",
-                                            "스컹크클라운",
-                                        ],
-                                        "sandaracinos": [
-                                            "Orange skunk clownfish",
-                                            "오렌지스컹크클라운",
-                                        ],
-                                        "nigripes": [
-                                            "Maldive anemonefish",
-                                            "몰디브클라운",
-                                        ],
-                                        "allardi": [
-                                            "Allard's clownfish",
-                                            "알라드클라운",
-                                        ],
-                                        "chrysogaster": [
-                                            "Mauritian anemonefish",
-                                            "모리셔스클라운",
-                                        ],
-                                        "latifasciatus": [
-                                            "Wide-band anemonefish",
-                                            "와이드밴드클라운",
-                                        ],
-                                        "leucokranos": [
-                                            "White-bonnet anemonefish",
-                                            "화이트보넷클라운",
-                                        ],
-                                        "mccullochi": [
-                                            "McCulloch's anemonefish",
-                                            "맥컬록클라운",
-                                        ],
-                                        "omanensis": [
-                                            "Oman anemonefish",
-                                            "오만클라운",
-                                        ],
-                                        "pacificus": [
-                                            "Pacific anemonefish",
-                                            "퍼시픽클라운",
-                                        ],
-                                        "rubrocinctus": [
-                                            "Australian anemonefish",
-                                            "오스트레일리안클라운",
-                                        ],
-                                        "thiellei": [
-                                            "Thielle's anemonefish",
-                                            "티엘레클라운",
-                                        ],
-                                        "tricinctus": [
-                                            "Three-band anemonefish",
-                                            "쓰리밴드클라운",
-                                        ],
-                                    },
-                                    "Premnas": {
-                                        "biaculeatus": [
-                                            "Maroon clownfish",
-                                            "Spine-cheek anemonefish",
-                                            "마룬클라운",
-                                        ]
-                                    },
-                                },
-                                "Pomacentrinae": {  # 자리돔아과 (댐셀피쉬, 크로미스)
-                                    "Chromis": {
-                                        "viridis": [
-                                            "Blue-green chromis",
-                                            "Green chromis",
-                                            "그린크로미스",
-                                        ],
-                                        "cyanea": [
-                                            "Blue reef chromis",
-                                            "Blue chromis",
-                                            "블루크로미스",
-                                        ],
-                                        "atripectoralis": [
-                                            "Black-axil chromis",
-                                            "Blackfin chromis",
-                                            "블랙핀크로미스",
-                                        ],
-                                        "vanderbilti": [
-                                            "Vanderbilt's chromis",
-                                            "반더빌트크로미스",
-                                        ],
-                                        "margaritifer": [
-                                            "Bicolor chromis",
-                                            "바이컬러크로미스",
-                                        ],
-                                        "dimidiata": [
-                                            "Half and half chromis",
-                                            "하프앤하프크로미스",
-                                        ],
-                                        "iomelas": [
-                                            "Half and half chromis",
-                                            "하프앤하프크로미스",
-                                        ],
-                                        "lepidolepis": [
-                                            "Scaly chromis",
-                                            "스케일리크로미스",
-                                        ],
-                                        "retrofasciata": [
-                                            "Black-bar chromis",
-                                            "블랙바크로미스",
-                                        ],
-                                        "weberi": [
-                                            "Weber's chromis",
-                                            "웨버크로미스",
-                                        ],
-                                    },
-                                    "Dascyllus": {
-                                        "trimaculatus": [
-                                            "Three-spot dascyllus",
-                                            "Domino damsel",
-                                            "도미노댐셀",
-                                        ],
-                                        "aruanus": [
-                                            "White-tailed dascyllus",
-                                            "Humbug dascyllus",
-                                            "험버그댐셀",
-                                        ],
-                                        "melanurus": [
-                                            "Four-stripe damselfish",
-                                            "Blacktail dascyllus",
-                                            "블랙테일댐셀",
-                                        ],
-                                        "carneus": [
-                                            "Cloudy dascyllus",
-                                            "클라우디댐셀",
-                                        ],
-                                        "reticulatus": [
-                                            "Reticulate dascyllus",
-                                            "레티큘레이트댐셀",
-                                        ],
-                                    },
-                                    "Chrysiptera": {
-                                        "cyanea": [
-                                            "Blue devil",
-                                            "Sapphire devil",
-                                            "블루데빌",
-                                        ],
-                                        "parasema": [
-                                            "Yellowtail blue damsel",
-                                            "옐로우테일블루댐셀",
-                                        ],
-                                        "hemicyanea": [
-                                            "Azure damselfish",
-                                            "애저댐셀",
-                                        ],
-                                        "springeri": [
-                                            "Springer's demoiselle",
-                                            "스프링거댐셀",
-                                        ],
-                                        "talboti": [
-                                            "Talbot's demoiselle",
-                                            "탈봇댐셀",
-                                        ],
-                                    },
-                                    "Amblyglyphidodon": {
-                                        "curacao": [
-                                            "Staghorn damselfish",
-                                            "스태그혼댐셀",
-                                        ],
-                                        "leucogaster": [
-                                            "Yellowbelly damselfish",
-                                            "옐로우벨리댐셀",
-                                        ],
-                                    },
-                                    "Neoglyphidodon": {
-                                        "oxyodon": [
-                                            "Neon velvet damsel",
-                                            "네온벨벳댐셀",
-                                        ],
-                                        "melas": [
-                                            "Bowtie damselfish",
-                                            "보우타이댐셀",
-                                        ],
-                                    },
-                                    "Pomacentrus": {
-                                        "coelestis": [
-                                            "Neon damselfish",
-                                            "네온댐셀",
-                                        ],
-                                        "pavo": [
-                                            "Sapphire damsel",
-                                            "사파이어댐셀",
-                                        ],
-                                        "alleni": [
-                                            "Andaman damsel",
-                                            "안다만댐셀",
-                                        ],
-                                    },
-                                },
-                            },
-                            "Chaetodontidae": {  # 나비고기과
-                                "Chaetodon": {
-                                    "auriga": [
-                                        "Threadfin butterflyfish",
-                                        "Cross-stripe butterfly",
-                                        "쓰레드핀버터플라이",
-                                    ],
-                                    "lunula": [
-                                        "Raccoon butterflyfish",
-                                        "Crescent-masked butterflyfish",
-                                        "라쿤버터플라이",
-                                    ],
-                                    "vagabundus": [
-                                        "Vagabond butterflyfish",
-                                        "Crisscross butterflyfish",
-                                        "바가본드버터플라이",
-                                    ],
-                                    "rafflesii": [
-                                        "Latticed butterflyfish",
-                                        "Raffle's butterflyfish",
-                                        "래플스버터플라이",
-                                    ],
-                                    "collare": [
-                                        "Pakistani butterflyfish",
-                                        "파키스탄버터플라이",
-                                    ],
-                                    "fasciatus": [
-                                        "Diagonal butterflyfish",
-                                        "Pyramid butterflyfish",
-                                        "파리미드버터플라이",
-                                        "다이아고날버터플라이",
-                                    ],
-                                    "kleini": [
-                                        "Klein's butterflyfish",
-                                        "클라인버터플라이",
-                                    ],
-                                    "melannotus": [
-                                        "Blackback butterflyfish",
-                                        "블랙백버터플라이",
-                                    ],
-                                    "miliaris": [
-                                        "Lemon butterflyfish",
-                                        "레몬버터플라이",
-                                    ],
-                                    "punctatofasciatus": [
-                                        "Spot-band butterflyfish",
-                                        "스팟밴드버터플라이",
-                                    ],
-                                    "semilarvatus": [
-                                        "Golden butterflyfish",
-                                        "골든버터플라이",
-                                    ],
-                                    "triangulum": [
-                                        "Triangle butterflyfish",
-                                        "트라이앵글버터플라이",
-                                    ],
-                                    "ulietensis": [
-                                        "Pacific double-saddle butterflyfish",
-                                        "퍼시픽더블새들버터플라이",
-                                    ],
-                                    "xanthocephalus": [
-                                        "Yellowhead butterflyfish",
-                                        "옐로우헤드버터플라이",
-                                    ],
-                                    "baronessa": [
-                                        "Eastern triangular butterflyfish",
-                                        "바로네사버터플라이",
-                                    ],
-                                    "burgessi": [
-                                        "Burgess' butterflyfish",
-                                        "버지스버터플라이",
-                                    ],
-                                    "citrinellus": [
-                                        "Speckled butterflyfish",
-                                        "스펙클드버터플라이",
-                                    ],
-                                    "decussatus": [
-                                        "Indian vagabond butterflyfish",
-                                        "인디언바가본드버터플라이",
-                                    ],
-                                    "ephippium": [
-                                        "Saddle butterflyfish",
-                                        "새들버터플라이",
-                                    ],
-                                    "falcula": [
-                                        "Blackwedged butterflyfish",
-                                        "블랙웨지드버터플라이",
-                                    ],
-                                    "flavirostris": [
-                                        "Black butterflyfish",
-                                        "블랙버터플라이",
-                                    ],
-                                    "lineolatus": [
-                                        "Lined butterflyfish",
-                                        "라인드버터플라이",
-                                    ],
-                                    "madagaskariensis": [
-                                        "Malagasy butterflyfish",
-                                        "말라가시버터플라이",
-                                    ],
-                                    "meyeri": [
-                                        "Meyer's butterflyfish",
-                                        "마이어버터플라이",
-                                    ],
-                                    "multicinctus": [
-                                        "Multiband butterflyfish",
-                                        "멀티밴드버터플라이",
-                                    ],
-                                    "ornatissimus": [
-                                        "Ornate butterflyfish",
-                                        "오네이트버터플라이",
-                                    ],
-                                    "pelewensis": [
-                                        "Sunset butterflyfish",
-                                        "선셋버터플라이",
-                                    ],
-                                    "plebeius": [
-                                        "Blue-blotch butterflyfish",
-                                        "블루블롯치버터플라이",
-                                    ],
-                                    "reticulatus": [
-                                        "Mailed butterflyfish",
-                                        "메일드버터플라이",
-                                    ],
-                                    "speculum": [
-                                        "Mirror butterflyfish",
-                                        "미러버터플라이",
-                                    ],
-                                    "tinkeri": [
-                                        "Tinker's butterflyfish",
-                                        "팅커버터플라이",
-                                    ],
-                                    "trifascialis": [
-                                        "Chevron butterflyfish",
-                                        "쉐브론버터플라이",
-                                    ],
-                                    "trifasciatus": [
-                                        "Melon butterflyfish",
-                                        "멜론버터플라이",
-                                    ],
-                                    "unimaculatus": [
-                                        "Teardrop butterflyfish",
-                                        "티어드롭버터플라이",
-                                    ],
-                                    "wiebeli": [
-                                        "Hong Kong butterflyfish",
-                                        "홍콩버터플라이",
-                                    ],
-                                    "xanthurus": [
-                                        "Pearlscale butterflyfish",
-                                        "펄스케일버터플라이",
-                                    ],
-                                    "zanzibarensis": [
-                                        "Zanzibar butterflyfish",
-                                        "잔지바르버터플라이",
-                                    ],
-                                    "larvatus": [
-                                        "Hooded butterflyfish",
-                                        "후드버터플라이",
-                                    ],
-                                    "paucifasciatus": [
-                                        "Red Sea raccoon butterflyfish",
-                                        "레드씨라쿤버터플라이",
-                                    ],
-                                    "pictus": [
-                                        "Horseshoe butterflyfish",
-                                        "호스슈버터플라이",
-                                    ],
-                                    "quadrimaculatus": [
-                                        "Four-spot butterflyfish",
-                                        "포스팟버터플라이",
-                                    ],
-                                    "rainfordi": [
-                                        "Rainford's butterflyfish",
-                                        "레인포드버터플라이",
-                                    ],
-                                    "semeion": [
-                                        "Dotted butterflyfish",
-                                        "도티드버터플라이",
-                                    ],
-                                    "smithi": [
-                                        "Smith's butterflyfish",
-                                        "스미스버터플라이",
-                                    ],
-                                    "striatus": [
-                                        "Banded butterflyfish",
-                                        "밴디드버터플라이",
-                                    ],
-                                    "trichrous": [
-                                        "Tahitian butterflyfish",
-                                        "타히티안버터플라이",
-                                    ],
-                                    "fremblii": [
-                                        "Bluelashed butterflyfish",
-                                        "블루래쉬드버터플라이",
-                                    ],
-                                    "gardineri": [
-                                        "Gardner's butterflyfish",
-                                        "가드너버터플라이",
-                                    ],
-                                    "guttatissimus": [
-                                        "Peppered butterflyfish",
-                                        "페퍼드버터플라이",
-                                    ],
-                                    "hoefleri": [
-                                        "Four-banded butterflyfish",
-                                        "포밴드버터플라이",
-                                    ],
-                                    "interruptus": [
-                                        "Yellow butterflyfish",
-                                        "옐로우버터플라이",
-                                    ],
-                                    "litus": [
-                                        "Speckled butterflyfish",
-                                        "스펙클드버터플라이",
-                                    ],
-                                    "marleyi": [
-                                        "Marley's butterflyfish",
-                                        "말리버터플라이",
-                                    ],
-                                    "nigropunctatus": [
-                                        "Black-spotted butterflyfish",
-                                        "블랙스팟버터플라이",
-                                    ],
-                                    "declivis": [
-                                        "Marquesas butterflyfish",
-                                        "데클라비스버터플라이",
-                                        "마르케사스버터플라이",
-                                    ],
-                                    "argentatus": [
-                                        "Asian butterflyfish",
-                                        "아시안버터플라이",
-                                    ],
-                                    "aureofasciatus": [
-                                        "Golden butterflyfish",
-                                        "골든버터플라이",
-                                    ],
-                                    "bennetti": [
-                                        "Bennett's butterflyfish",
-                                        "베넷버터플라이",
-                                    ],
-                                    "capistratus": [
-                                        "Foureye butterflyfish",
-                                        "포아이버터플라이",
-                                    ],
-                                    "daedalma": [
-                                        "Wrought iron butterflyfish",
-                                        "로트아이언버터플라이",
-                                    ],
-                                    "flavocoronatus": [
-                                        "Yellow-crowned butterflyfish",
-                                        "옐로우크라운드버터플라이",
-                                    ],
-                                    "guentheri": [
-                                        "Gunther's butterflyfish",
-                                        "군터버터플라이",
-                                    ],
-                                    "hemichrysus": [
-                                        "Threeband butterflyfish",
-                                        "쓰리밴드버터플라이",
-                                    ],
-                                    "humeralis": [
-                                        "Three-banded butterflyfish",
-                                        "쓰리밴디드버터플라이",
-                                    ],
-                                    "jayakari": [
-                                        "Jayakar's butterflyfish",
-                                        "자야카르버터플라이",
-                                    ],
-                                    "leucopleura": [
-                                        "Somali butterflyfish",
-                                        "소말리버터플라이",
-                                    ],
-                                    "lunulatus": [
-                                        "Oval butterflyfish",
-                                        "오발버터플라이",
-                                    ],
-                                    "melapterus": [
-                                        "Arabian butterflyfish",
-                                        "아라비안버터플라이",
-                                    ],
-                                    "mitratus": [
-                                        "Indian butterflyfish",
-                                        "인디언버터플라이",
-                                    ],
-                                    "nippon": [
-                                        "Japanese butterflyfish",
-                                        "재패니즈버터플라이",
-                                    ],
-                                    "ocellicaudus": [
-                                        "Spot-tail butterflyfish",
-                                        "스팟테일버터플라이",
-                                    ],
-                                    "octofasciatus": [
-                                        "Eightband butterflyfish",
-                                        "에잇밴드버터플라이",
-                                    ],
-                                    "oxycephalus": [
-                                        "Spot-nape butterflyfish",
-                                        "스팟네이프버터플라이",
-                                    ],
-                                },
-                                "Parachaetodon": {
-                                    "ocellatus": [
-                                        "Sixspine butterflyfish",
-                                        "식스스파인버터플라이",
-                                    ],
-                                },
-                                "Prognathodes": {
-                                    "aculeatus": [
-                                        "Longsnout butterflyfish",
-                                        "롱스나웃버터플라이",
-                                    ],
-                                    "basabei": [
-                                        "Basabe's butterflyfish",
-                                        "바사베버터플라이",
-                                    ],
-                                    "dichrous": [
-                                        "Bicolor butterflyfish",
-                                        "바이컬러버터플라이",
-                                    ],
-                                    "falcifer": [
-                                        "Scythe butterflyfish",
-                                        "사이드버터플라이",
-                                    ],
-                                    "guyanensis": [
-                                        "French butterflyfish",
-                                        "프렌치버터플라이",
-                                    ],
-                                },
-                                "Heniochus": {
-                                    "acuminatus": [
-                                        "Pennant coralfish",
-                                        "Longfin bannerfish",
-                                        "페넌트코랄피쉬",
-                                    ],
-                                    "diphreutes": [
-                                        "Schooling bannerfish",
-                                        "False moorish idol",
-                                        "스쿨링배너피쉬",
-                                    ],
-                                    "intermedius": [
-                                        "Red Sea bannerfish",
-                                        "레드씨배너피쉬",
-                                    ],
-                                    "singularius": [
-                                        "Singular bannerfish",
-                                        "싱귤러배너피쉬",
-                                    ],
-                                    "varius": [
-                                        "Horned bannerfish",
-                                        "혼드배너피쉬",
-                                    ],
-                                },
-                                "Hemitaurichthys": {
-                                    "polylepis": [
-                                        "Pyramid butterflyfish",
-                                        "피라미드버터플라이",
-                                    ],
-                                    "zoster": [
-                                        "Brown-and-white butterflyfish",
-                                        "브라운앤화이트버터플라이",
-                                    ],
-                                },
-                                "Forcipiger": {
-                                    "flavissimus": [
-                                        "Yellow longnose butterflyfish",
-                                        "Forceps fish",
-                                        "옐로우롱노즈",
-                                    ],
-                                    "longirostris": [
-                                        "Longnose butterflyfish",
-                                        "Big longnose butterflyfish",
-                                        "빅롱노즈",
-                                    ],
-                                },
-                                "Chelmon": {
-                                    "rostratus": [
-                                        "Copperband butterflyfish",
-                                        "Beaked coralfish",
-                                        "코퍼밴드버터플라이",
-                                    ]
-                                },
-                            },
-                            "Labridae": {  # 놀래기과 (Wrasse)
-                                "Labroides": {
-                                    "dimidiatus": [
-                                        "Bluestreak cleaner wrasse",
-                                        "블루스트릭클리너",
-                                    ],
-                                    "bicolor": [
-                                        "Bicolor cleaner wrasse",
-                                        "바이컬러클리너",
-                                    ],
-                                    "pectoralis": [
-                                        "Blackspot cleaner wrasse",
-                                        "블랙스팟클리너",
-                                    ],
-                                    "phthirophagus": [
-                                        "Hawaiian cleaner wrasse",
-                                        "하와이안클리너",
-                                    ],
-                                    # 자주 수입되는 추가 클리너랩스 (필요 시 확장 가능)
-                                    # "terralabroides": [
-                                    #     "Red Sea cleaner wrasse",
-                                    #     "레드씨클리너",
-                                    # ],  # 확인 후 활성화
-                                },
-                                "Thalassoma": {
-                                    "bifasciatum": [
-                                        "Bluehead wrasse",
-                                        "블루헤드놀래기",
-                                    ],
-                                    "lunare": [
-                                        "Moon wrasse",
-                                        "Green moon wrasse",
-                                        "문놀래기",
-                                    ],
-                                    "lutescens": [
-                                        "Sunset wrasse",
-                                        "선셋놀래기",
-                                    ],
-                                    "hardwicke": [
-                                        "Hardwick's wrasse",
-                                        "하드윅놀래기",
-                                    ],
-                                    "klunzingeri": [
-                                        "Klunzinger's wrasse",
-                                        "클룬징거놀래기",
-                                    ],
-                                    "quinquevittatum": [
-                                        "Five-stripe wrasse",
-                                        "파이브스트라이프놀래기",
-                                    ],
-                                    # 추가로 수입되는 종류
-                                    "purpureum": [
-                                        "Surge wrasse",
-                                        "서지놀래기",
-                                    ],
-                                    "rueppellii": [
-                                        "Red Sea wrasse",
-                                        "레드씨놀래기",
-                                    ],
-                                },
-                                "Pseudocheilinus": {
-                                    "hexataenia": [
-                                        "Six-line wrasse",
-                                        "식스라인놀래기",
-                                    ],
-                                    "tetrataenia": [
-                                        "Four-line wrasse",
-                                        "포라인놀래기",
-                                    ],
-                                    "evanidus": [
-                                        "Striated wrasse",
-                                        "스트라이에이티드놀래기",
-                                    ],
-                                    "ocellatus": [
-                                        "Mystery wrasse",
-                                        "미스터리놀래기",
-                                    ],
-                                    "dispar": [
-                                        "Dispar wrasse",
-                                        "디스파놀래기",
-                                    ],
-                                },
-                                "Cirrhilabrus": {
-                                    "cyanopleura": [
-                                        "Blueside fairy wrasse",
-                                        "블루사이드페어리",
-                                    ],
-                                    "scottorum": [
-                                        "Scott's fairy wrasse",
-                                        "스콧페어리",
-                                    ],
-                                    "exquisitus": [
-                                        "Exquisite fairy wrasse",
-                                        "엑스퀴지트페어리",
-                                    ],
-                                    "lineatus": [
-                                        "Lined fairy wrasse",
-                                        "라인드페어리",
-                                    ],
-                                    "lubbocki": [
-                                        "Lubbock's fairy wrasse",
-                                        "루복페어리",
-                                    ],
-                                    "rubriventralis": [
-                                        "Social fairy wrasse",
-                                        "소셜페어리",
-                                    ],
-                                    "rubeus": [
-                                        "Red velvet fairy wrasse",
-                                        "Ruby fairy wrasse",
-                                        "레드벨벳페어리",
-                                        "루비페어리",
-                                    ],
-                                    "lanceolatus": [
-                                        "Lanceolate fairy wrasse",
-                                        "랜스올레이트페어리",
-                                    ],
-                                    "solorensis": [
-                                        "Red-headed fairy wrasse",
-                                        "레드헤드페어리",
-                                    ],
-                                    "jordani": [
-                                        "Jordan's fairy wrasse",
-                                        "조던페어리",
-                                    ],
-                                    "temminckii": [
-                                        "Temminck's fairy wrasse",
-                                        "템민크페어리",
-                                    ],
-                                    "punctatus": [
-                                        "Fine-spotted fairy wrasse",
-                                        "파인스팟페어리",
-                                    ],
-                                    "rhomboidalis": [
-                                        "Rhomboid fairy wrasse",
-                                        "롬보이드페어리",
-                                    ],
-                                    "katherinae": [
-                                        "Katherine's fairy wrasse",
-                                        "캐서린페어리",
-                                    ],
-                                    # 추가 인기 페어리 래스
-                                    "naokoae": [
-                                        "Naoko's fairy wrasse",
-                                        "나오코페어리",
-                                    ],
-                                    "rubrisquamis": [
-                                        "Red velvet scaled fairy wrasse",
-                                        "레드벨벳스케일드페어리",
-                                    ],
-                                    "condei": [
-                                        "Conde's fairy wrasse",
-                                        "콘데이페어리",
-                                    ],
-                                    "finifenmaa": [
-                                        "Rose-veiled fairy wrasse",
-                                        "로즈베일드페어리",
-                                    ],
-                                },
-                                "Paracheilinus": {
-                                    "carpenteri": [
-                                        "Carpenter's flasher wrasse",
-                                        "카펜터플래셔",
-                                    ],
-                                    "filamentosus": [
-                                        "Filament flasher wrasse",
-                                        "필라멘트플래셔",
-                                    ],
-                                    "mccoskeri": [
-                                        "McCosker's flasher wrasse",
-                                        "맥코스커플래셔",
-                                    ],
-                                    "angulatus": [
-                                        "Angular flasher wrasse",
-                                        "앵귤러플래셔",
-                                    ],
-                                    "attenuatus": [
-                                        "Attenuate flasher wrasse",
-                                        "어테뉴에이트플래셔",
-                                    ],
-                                    "octotaenia": [
-                                        "Eight-line flasher wrasse",
-                                        "에잇라인플래셔",
-                                    ],
-                                    # 추가 플래셔 래스
-                                    "flavianalis": [
-                                        "Yellowfin flasher wrasse",
-                                        "옐로우핀플래셔",
-                                    ],
-                                    "lineopunctatus": [
-                                        "Linespot flasher wrasse",
-                                        "라인스팟플래셔",
-                                    ],
-                                    "rubricaudalis": [
-                                        "Red-tailed flasher wrasse",
-                                        "레드테일플래셔",
-                                    ],
-                                    "cyaneus": [
-                                        "Blue flasher wrasse",
-                                        "블루플래셔",
-                                    ],
-                                },
-                                "Halichoeres": {
-                                    "chrysus": [
-                                        "Canary wrasse",
-                                        "카나리놀래기",
-                                    ],
-                                    "marginatus": [
-                                        "Dusky wrasse",
-                                        "더스키놀래기",
-                                    ],
-                                    "melanurus": [
-                                        "Hoeven's wrasse",
-                                        "호벤놀래기",
-                                    ],
-                                    "ornatissimus": [
-                                        "Ornate wrasse",
-                                        "오네이트놀래기",
-                                    ],
-                                    "iridis": [
-                                        "Radiant wrasse",
-                                        "래디언트놀래기",
-                                    ],
-                                    "leucoxanthus": [
-                                        "Canarytop wrasse",
-                                        "카나리탑놀래기",
-                                    ],
-                                    "trispilus": [
-                                        "Three-spot wrasse",
-                                        "쓰리스팟놀래기",
-                                    ],
-                                    # 추가로 자주 유통되는 할리코에레스
-                                    "hortulanus": [
-                                        "Checkerboard wrasse",
-                                        "체커보드놀래기",
-                                    ],
-                                    "biocellatus": [
-                                        "Red-lined wrasse",
-                                        "레드라인드놀래기",
-                                    ],
-                                    "cosmetus": [
-                                        "Adorned wrasse",
-                                        "어도른드놀래기",
-                                    ],
-                                },
-                                "Coris": {
-                                    "gaimard": [
-                                        "Yellowtail coris",
-                                        "옐로우테일코리스",
-                                    ],
-                                    "formosa": [
-                                        "Formosa coris",
-                                        "포모사코리스",
-                                    ],
-                                    "aygula": [
-                                        "Clown coris",
-                                        "클라운코리스",
-                                    ],
-                                    "julis": [
-                                        "Mediterranean rainbow wrasse",
-                                        "메디터레니안레인보우",
-                                    ],
-                                    # 추가 Coris 속
-                                    "picta": [
-                                        "African coris",
-                                        "아프리칸코리스",
-                                    ],
-                                    "vexillifer": [
-                                        "Bicolor coris",
-                                        "바이컬러코리스",
-                                    ],
-                                },
-                                "Novaculichthys": {
-                                    "taeniourus": [
-                                        "Rockmover wrasse",
-                                        "Dragon wrasse",
-                                        "드래곤놀래기",
-                                    ],
-                                },
-                                "Pseudojuloides": {
-                                    # Cirrhilabrus naokoae 가 올바른 분류
-                                    # Pseudojuloides 속에 naokoae 없음. (중복/오류 제거)
-                                    "severnsi": [
-                                        "Severn's wrasse",
-                                        "서번스놀래기",
-                                    ],
-                                },
-                                # Macropharyngodon 중복 블록 통합 및 확장
-                                "Macropharyngodon": {
-                                    "meleagris": [
-                                        "Leopard wrasse",
-                                        "레오파드놀래기",
-                                    ],
-                                    "bipartitus": [
-                                        "Divided wrasse",
-                                        "디바이디드놀래기",
-                                    ],
-                                    "ornatus": [
-                                        "Ornate leopard wrasse",
-                                        "오네이트레오파드놀래기",
-                                    ],
-                                    "negrosensis": [
-                                        "Yellow-spotted leopard wrasse",
-                                        "옐로우스팟레오파드놀래기",
-                                    ],
-                                    "choati": [
-                                        "Choat's leopard wrasse",
-                                        "초아티레오파드놀래기",
-                                    ],
-                                    "kuiteri": [
-                                        "Kuiter's leopard wrasse",
-                                        "쿠이테리레오파드놀래기",
-                                    ],
-                                },
-                                "Cirrihilabrus": {
-                                    "solorensis": [
-                                        "Red head solon fairy wrasse",
-                                        "솔론페어리",
-                                    ],
-                                    "cyanopleura": [
-                                        "Blue-sided fairy wrasse",
-                                        "블루사이드페어리",
-                                    ],
-                                    "lineatus": [
-                                        "Lineatus fairy wrasse",
-                                        "리네이투스페어리",
-                                    ],
-                                    "lubbocki": [
-                                        "Lubbock's fairy wrasse",
-                                        "러벅페어리",
-                                    ],
-                                    "exquisitus": [
-                                        "Exquisite fairy wrasse",
-                                        "엑스퀴짓페어리",
-                                    ],
-                                    "jordani": [
-                                        "Flame fairy wrasse",
-                                        "플레임페어리",
-                                    ],
-                                    "lunatus": [
-                                        "Lunate fairy wrasse",
-                                        "루네이트페어리",
-                                    ],
-                                    "rubrofuscus": [
-                                        "Ruby-head fairy wrasse",
-                                        "루비헤드페어리",
-                                    ],
-                                    "naokoae": [
-                                        "Naoko fairy wrasse",
-                                        "나오코페어리",
-                                    ],
-                                    "rubrimarginatus": [
-                                        "Red margin fairy wrasse",
-                                        "레드마진페어리",
-                                    ],
-                                },
-                                "Bodianus": {
-                                    "rufus": [
-                                        "Spanish hogfish",
-                                        "스패니쉬호그피쉬",
-                                    ],
-                                    "diana": [
-                                        "Diana's hogfish",
-                                        "다이아나호그피쉬",
-                                    ],
-                                    "anthioides": [
-                                        "Lyretail hogfish",
-                                        "라이어테일호그피쉬",
-                                    ],
-                                    "axillaris": [
-                                        "Coral hogfish",
-                                        "코랄호그피쉬",
-                                    ],
-                                    # 추가 호그피쉬
-                                    "mesothorax": [
-                                        "Split-level hogfish",
-                                        "스플릿레벨호그피쉬",
-                                    ],
-                                    "bimaculatus": [
-                                        "Twinspot hogfish",
-                                        "트윈스팟호그피쉬",
-                                    ],
-                                    "sepiacaudus": [
-                                        "Candy cane hogfish",
-                                        "캔디케인호그피쉬",
-                                    ],
-                                },
-                                "Anampses": {
-                                    "meleagrides": [
-                                        "Spotted wrasse",
-                                        "스팟티드놀래기",
-                                    ],
-                                    "chrysocephalus": [
-                                        "Psychedelic wrasse",
-                                        "사이키델릭놀래기",
-                                    ],
-                                    # 추가 타마린 래스
-                                    "femininus": [
-                                        "Blue-stripe tamarin wrasse",
-                                        "블루스트라이프타마린",
-                                    ],
-                                    "lennardi": [
-                                        "Lennard's wrasse",
-                                        "레나드놀래기",
-                                    ],
-                                },
-                                "Stethojulis": {
-                                    "bandanensis": [
-                                        "Red shoulder wrasse",
-                                        "레드숄더놀래기",
-                                    ],
-                                    "strigiventer": [
-                                        "Three-ribbon wrasse",
-                                        "쓰리리본놀래기",
-                                    ],
-                                    # 필요시 추가 가능
-                                },
-                            },
-                            "Apogonidae": {  # 천축어과 (카디널피쉬)
-                                "Sphaeramia": {
-                                    "nematoptera": [
-                                        "Pajama cardinalfish",
-                                        "파자마카디널",
-                                    ],
-                                    "orbicularis": [
-                                        "Orbiculate cardinalfish",
-                                        "오비큘레이트카디널",
-                                    ],
-                                },
-                                "Pterapogon": {
-                                    "kauderni": [
-                                        "Banggai cardinalfish",
-                                        "방가이카디널",
-                                    ]
-                                },
-                                # 재분류 참고: 과거 다수 종이
-                                # Ostorhinchus / Zoramia / Taeniamia 로 이동
-                                # Apogon 는 유통상 Flamefish (A. maculatus) 위주
-                                "Apogon": {
-                                    "maculatus": [
-                                        "Flamefish",
-                                        "플레임피쉬",
-                                    ],
-                                },
-                                "Cheilodipterus": {
-                                    "macrodon": [
-                                        "Large-toothed cardinalfish",
-                                        "라지투스카디널",
-                                    ],
-                                    "quinquelineatus": [
-                                        "Five-lined cardinalfish",
-                                        "파이브라인드카디널",
-                                    ],
-                                    "artus": [
-                                        "Wolf cardinalfish",
-                                        "울프카디널",
-                                    ],
-                                    "intermedius": [
-                                        "Intermediate cardinalfish",
-                                        "인터미디어트카디널",
-                                    ],
-                                },
-                                "Ostorhinchus": {
-                                    "angustatus": [
-                                        "Broad-striped cardinalfish",
-                                        "브로드스트라이프카디널",
-                                    ],
-                                    "aureus": [
-                                        "Ring-tailed cardinalfish",
-                                        "링테일카디널",
-                                    ],
-                                    "capricornis": [
-                                        "Capricorn cardinalfish",
-                                        "카프리콘카디널",
-                                    ],
-                                    "chrysopomus": [
-                                        "Yellow-fin cardinalfish",
-                                        "옐로우핀카디널",
-                                    ],
-                                    "cyanosoma": [
-                                        "Yellow-striped cardinalfish",
-                                        "옐로우스트라이프카디널",
-                                    ],
-                                    "doederleini": [
-                                        "Doederlein's cardinalfish",
-                                        "되덜라인카디널",
-                                    ],
-                                    "compressus": [
-                                        "Ochre-striped cardinalfish",
-                                        "오커스트라이프카디널",
-                                    ],
-                                    "cookii": [
-                                        "Cook's cardinalfish",
-                                        "쿡카디널",
-                                    ],
-                                    "exostigma": [
-                                        "Narrowstripe cardinalfish",
-                                        "내로우스트라이프카디널",
-                                    ],
-                                    "hartzfeldii": [
-                                        "Hartzfeld's cardinalfish",
-                                        "하츠펠드카디널",
-                                    ],
-                                    "parvulus": [
-                                        "Redspot cardinalfish",
-                                        "레드스팟카디널",
-                                    ],
-                                    "apogonoides": [
-                                        "Short-tooth cardinal",
-                                        "쇼트투스카디널",
-                                    ],
-                                    "fleurieu": [
-                                        "Cardinalfish",
-                                        "카디널피쉬",
-                                    ],
-                                    "hoevenii": [
-                                        "Frosted cardinalfish",
-                                        "프로스티드카디널",
-                                    ],
-                                },
-                                "Zoramia": {
-                                    "leptacantha": [
-                                        "Threadfin cardinalfish",
-                                        "쓰레드핀카디널",
-                                    ],
-                                    "fragilis": [
-                                        "Fragile cardinalfish",
-                                        "프래질카디널",
-                                    ],
-                                },
-                                "Taeniamia": {
-                                    "zosterophora": [
-                                        "Zoster cardinalfish",
-                                        "조스터카디널",
-                                    ],
-                                },
-                                "Rhabdamia": {
-                                    "gracilis": [
-                                        "Longspine cardinalfish",
-                                        "롱스파인카디널",
-                                    ],
-                                },
-                                "Pristiapogon": {
-                                    "fraenatus": [
-                                        "Bridled cardinalfish",
-                                        "브라이들드카디널",
-                                    ],
-                                },
-                                # 선택적(드물게 유통) - 필요 시 주석 해제
-                                # "Apogonichthyoides": {
-                                #     "melas": [
-                                #         "Black cardinalfish",
-                                #         "블랙카디널",
-                                #     ],
-                                # },
-                            },
-                        },
-                        "Blenniiformes": {  # 블레니목
-                            "Blenniidae": {  # 블레니과
-                                "Meiacanthus": {
-                                    "grammistes": [
-                                        "Striped poison-fang blenny",
-                                        "스트라이프드포이즌블레니",
-                                    ],
-                                    "smithi": [
-                                        "Smith's fang blenny",
-                                        "스미스팽블레니",
-                                    ],
-                                    "atrodorsalis": [
-                                        "Forktail blenny",
-                                        "포크테일블레니",
-                                    ],
-                                    "bundoon": [
-                                        "Bundoon blenny",
-                                        "분둔블레니",
-                                    ],
-                                    "ditrema": [
-                                        "One-stripe poison-fang blenny",
-                                        "원스트라이프포이즌블레니",
-                                    ],
-                                    "kamoharai": [
-                                        "Kamohara blenny",
-                                        "카모하라블레니",
-                                    ],
-                                    "lineatus": [
-                                        "Lined fangblenny",
-                                        "라인드팽블레니",
-                                    ],
-                                    "luteus": [
-                                        "Yellow poison-fang blenny",
-                                        "옐로우포이즌블레니",
-                                    ],
-                                    "nigrolineatus": [
-                                        "Blackline fangblenny",
-                                        "블랙라인팽블레니",
-                                    ],
-                                    "oualanensis": [
-                                        "Oualan fangblenny",
-                                        "오우알란팽블레니",
-                                    ],
-                                },
-                                "Ecsenius": {
-                                    "bicolor": [
-                                        "Bicolor blenny",
-                                        "바이컬러블레니",
-                                    ],
-                                    "midas": [
-                                        "Midas blenny",
-                                        "미다스블레니",
-                                    ],
-                                    "axelrodi": [
-                                        "Axelrod's combtooth blenny",
-                                        "액셀로드블레니",
-                                    ],
-                                    "bandanus": [
-                                        "Banda combtooth blenny",
-                                        "반다블레니",
-                                    ],
-                                    "bathi": [
-                                        "Bath's combtooth blenny",
-                                        "바스블레니",
-                                    ],
-                                    "dentex": [
-                                        "Fiji combtooth blenny",
-                                        "피지블레니",
-                                    ],
-                                    "frontalis": [
-                                        "Smooth-fin blenny",
-                                        "스무스핀블레니",
-                                    ],
-                                    "gravieri": [
-                                        "Red Sea mimic blenny",
-                                        "레드씨미믹블레니",
-                                    ],
-                                    "lineatus": [
-                                        "Linear blenny",
-                                        "리니어블레니",
-                                    ],
-                                    "mandibularis": [
-                                        "Queensland blenny",
-                                        "퀸즐랜드블레니",
-                                    ],
-                                    "namiyei": [
-                                        "Black comb-tooth",
-                                        "블랙콤투스",
-                                    ],
-                                    "pictus": [
-                                        "White-lined comb-tooth",
-                                        "화이트라인드콤투스",
-                                    ],
-                                    "stigmatura": [
-                                        "Tail-spot combtooth blenny",
-                                        "테일스팟블레니",
-                                    ],
-                                    # 추가 자주 유통
-                                    "springeri": [
-                                        "Springer's combtooth blenny",
-                                        "스프링거블레니",
-                                    ],
-                                    "tricolor": [
-                                        "Tricolor blenny",
-                                        "트라이컬러블레니",
-                                    ],
-                                    "prosopotaenia": [
-                                        "Banded blenny",
-                                        "밴디드블레니",
-                                    ],
-                                },
-                                "Salarias": {
-                                    "fasciatus": [
-                                        "Jewelled blenny",
-                                        "Lawnmower blenny",
-                                        "론모어블레니",
-                                    ],
-                                    "guttatus": [
-                                        "Breast-spot blenny",
-                                        "브레스트스팟블레니",
-                                    ],
-                                    "patzneri": [
-                                        "Patzner's blenny",
-                                        "패츠너블레니",
-                                    ],
-                                    "ramosus": [
-                                        "Starry blenny",
-                                        "스타리블레니",
-                                    ],
-                                    "segmentatus": [
-                                        "Segmented blenny",
-                                        "세그먼티드블레니",
-                                    ],
-                                },
-                                "Atrosalarias": {
-                                    "fuscus": [
-                                        "Brown coral blenny",
-                                        "브라운코랄블레니",
-                                    ],
-                                    # Added
-                                    "holomelas": [
-                                        "Black blenny",
-                                        "블랙블레니",
-                                    ],
-                                },
-                                "Blenniella": {
-                                    "bilitonensis": [
-                                        "Billiton combtooth blenny",
-                                        "빌리톤블레니",
-                                    ],
-                                    "chrysospilos": [
-                                        "Red-spotted blenny",
-                                        "레드스팟블레니",
-                                    ],
-                                    "cyanostigma": [
-                                        "Bluespotted blenny",
-                                        "블루스팟블레니",
-                                    ],
-                                    "gibbifrons": [
-                                        "Hump-head blenny",
-                                        "험프헤드블레니",
-                                    ],
-                                },
-                                "Cirripectes": {
-                                    "castaneus": [
-                                        "Chestnut eyelash-blenny",
-                                        "체스넛아이래쉬블레니",
-                                    ],
-                                    "filamentosus": [
-                                        "Filamentous blenny",
-                                        "필라멘토스블레니",
-                                    ],
-                                    "fuscoguttatus": [
-                                        "Spotted eyelash blenny",
-                                        "스팟티드아이래쉬블레니",
-                                    ],
-                                    "polyzona": [
-                                        "Barred blenny",
-                                        "바드블레니",
-                                    ],
-                                    "springeri": [
-                                        "Springer's blenny",
-                                        "스프링거블레니",
-                                    ],
-                                    "stigmaticus": [
-                                        "Red-streaked blenny",
-                                        "레드스트릭드블레니",
-                                    ],
-                                    "variolosus": [
-                                        "Red-speckled blenny",
-                                        "레드스펙클드블레니",
-                                    ],
-                                },
-                                # 산호 식해 위험, 주의 필요
-                                "Exallias": {
-                                    "brevis": [
-                                        "Leopard blenny",
-                                        "레오파드블레니",
-                                    ]
-                                },
-                                # 모방/물기 이슈, 주의
-                                "Plagiotremus": {
-                                    "rhinorhynchos": [
-                                        "Bluestriped fangblenny",
-                                        "블루스트라이프팽블레니",
-                                    ]
-                                },
-                            },
-                            "Chaenopsidae": {  # 파이크블레니과
-                                "Acanthemblemaria": {
-                                    "maria": [
-                                        "Secretary blenny",
-                                        "세크레터리블레니",
-                                    ],
-                                    "spinosa": [
-                                        "Spinyhead blenny",
-                                        "스파이니헤드블레니",
-                                    ],
-                                }
-                            },
-                            "Clinidae": {  # 클라이니드과
-                                "Labrisomus": {
-                                    "nuchipinnis": [
-                                        "Hairy blenny",
-                                        "헤어리블레니",
-                                    ]
-                                }
-                            },
-                        },
-                        "Ephippiformes": {  # 뱃피쉬목
-                            "Ephippidae": {  # 뱃피쉬과
-                                "Platax": {
-                                    "orbicularis": [
-                                        "Orbicular batfish",
-                                        "Circular batfish",
-                                        "오비큘러뱃피쉬",
-                                    ],
-                                    "teira": [
-                                        "Longfin batfish",
-                                        "Teira batfish",
-                                        "롱핀뱃피쉬",
-                                    ],
-                                    "pinnatus": [
-                                        "Pinnate batfish",
-                                        "Dusky batfish",
-                                        "피네이트뱃피쉬",
-                                    ],
-                                    "batavianus": [
-                                        "Batavia batfish",
-                                        "바타비아뱃피쉬",
-                                    ],
-                                    "boersii": [
-                                        "Golden spadefish",
-                                        "Boers' batfish",
-                                        "골든스페이드피쉬",
-                                    ],
-                                },
-                                "Zabidius": {
-                                    "novemaculeatus": [
-                                        "Nine-spotted batfish",
-                                        "나인스팟뱃피쉬",
-                                    ]
-                                },
-                            },
-                            "Drepaneidae": {  # 초승달고기과
-                                "Drepane": {
-                                    "punctata": [
-                                        "Spotted sicklefish",
-                                        "스팟티드시클피쉬",
-                                    ]
-                                }
-                            },
-                        },
-                        "Zancliformes": {  # 무어리쉬아이돌목
-                            "Zanclidae": {  # 무어리쉬아이돌과
-                                "Zanclus": {
-                                    "cornutus": [
-                                        "Moorish idol",
-                                        "무어리쉬아이돌",
-                                        "모리셔스우상",
-                                    ]
-                                }
-                            }
-                        },
-                    },
-                    "Tetraodontomorpha": {  # 복어상목
-                        "Tetraodontiformes": {  # 복어목
-                            "Tetraodontidae": {  # 복어과
-                                "Arothron": {
-                                    "nigropunctatus": [
-                                        "Blackspotted puffer",
-                                        "Dog-faced puffer",
-                                        "도그페이스퍼퍼",
-                                    ],
-                                    "meleagris": [
-                                        "Guineafowl puffer",
-                                        "Golden puffer",
-                                        "기니파울퍼퍼",
-                                    ],
-                                    "hispidus": [
-                                        "White-spotted puffer",
-                                        "화이트스팟퍼퍼",
-                                    ],
-                                    "mappa": [
-                                        "Map puffer",
-                                        "맵퍼퍼",
-                                    ],
-                                    "stellatus": [
-                                        "Starry puffer",
-                                        "스타리퍼퍼",
-                                        # Takifugu niphobles 도 같은 통칭 사용 → 주의
-                                    ],
-                                    "reticularis": [
-                                        "Reticulated puffer",
-                                        "레티큘레이티드퍼퍼",
-                                    ],
-                                    "manilensis": [
-                                        "Narrow-lined puffer",
-                                        "내로우라인드퍼퍼",
-                                    ],
-                                },
-                                "Canthigaster": {
-                                    "valentini": [
-                                        "Valentini puffer",
-                                        "Black-saddled toby",
-                                        "발렌티니퍼퍼",
-                                    ],
-                                    "solandri": [
-                                        "Spotted sharpnose puffer",
-                                        "Blue-spotted puffer",
-                                        "블루스팟퍼퍼",
-                                    ],
-                                    "coronata": [
-                                        "Crowned puffer",
-                                        "크라운드퍼퍼",
-                                    ],
-                                    "janthinoptera": [
-                                        "Honeycomb toby",
-                                        "허니콤토비",
-                                    ],
-                                    "margaritata": [
-                                        "Pearl toby",
-                                        "펄토비",
-                                    ],
-                                    "rostrata": [
-                                        "Caribbean sharpnose-puffer",
-                                        "카리비안샤프노즈퍼퍼",
-                                    ],
-                                    # 자주 유통 추가
-                                    "amboinensis": [
-                                        "Ambon toby",
-                                        "암본토비",
-                                    ],
-                                    "epilampra": [
-                                        "Lantern toby",
-                                        "랜턴토비",
-                                    ],
-                                },
-                                "Takifugu": {
-                                    "niphobles": [
-                                        "Starry puffer",
-                                        "스타리퍼퍼",
-                                        # Arothron stellatus 와 공명
-                                    ]
-                                },
-                            },
-                            "Balistidae": {  # 쥐치과 (트리거피쉬)
-                                "Rhinecanthus": {
-                                    "aculeatus": [
-                                        "Lagoon triggerfish",
-                                        "Blackbar triggerfish",
-                                        "라군트리거",
-                                    ],
-                                    "rectangulus": [
-                                        "Wedgetail triggerfish",
-                                        "Rectangle triggerfish",
-                                        "웨지테일트리거",
-                                    ],
-                                    "assasi": [
-                                        "Picasso triggerfish",
-                                        "피카소트리거",
-                                    ],
-                                },
-                                "Balistoides": {
-                                    "conspicillum": [
-                                        "Clown triggerfish",
-                                        "Big-spotted triggerfish",
-                                        "클라운트리거",
-                                    ],
-                                    "viridescens": [
-                                        "Titan triggerfish",
-                                        "타이탄트리거",
-                                    ],
-                                },
-                                "Balistes": {
-                                    "vetula": [
-                                        "Queen triggerfish",
-                                        "퀸트리거",
-                                    ]
-                                },
-                                "Odonus": {
-                                    "niger": [
-                                        "Red-toothed triggerfish",
-                                        "레드투스트리거",
-                                    ]
-                                },
-                                "Sufflamen": {
-                                    "bursa": [
-                                        "Scythe triggerfish",
-                                        "사이드트리거",
-                                    ],
-                                    "chrysopterum": [
-                                        "Halfmoon triggerfish",
-                                        "하프문트리거",
-                                    ],
-                                },
-                                "Xanthichthys": {
-                                    "auromarginatus": [
-                                        "Gilded triggerfish",
-                                        "길디드트리거",
-                                    ],
-                                    "mento": [
-                                        "Redtail triggerfish",
-                                        "레드테일트리거",
-                                    ],
-                                    "ringens": [
-                                        "Sargassum triggerfish",
-                                        "사가섬트리거",
-                                    ],
-                                },
-                                "Pseudobalistes": {
-                                    "fuscus": [
-                                        "Blue triggerfish",
-                                        "Blueface triggerfish",
-                                        "블루페이스트리거",
-                                    ],
-                                    "flavimarginatus": [
-                                        "Yellowmargin triggerfish",
-                                        "옐로우마진트리거",
-                                    ],
-                                },
-                                "Melichthys": {
-                                    "niger": [
-                                        "Black triggerfish",
-                                        "블랙트리거",
-                                    ],
-                                    "vidua": [
-                                        "Pinktail triggerfish",
-                                        "핑크테일트리거",
-                                    ],
-                                },
-                                "Abalistes": {
-                                    "stellaris": [
-                                        "Starry triggerfish",
-                                        "스타리트리거",
-                                    ],
-                                },
-                            },
-                            "Monacanthidae": {  # 쥐치과 (파일피쉬)
-                                "Oxymonacanthus": {
-                                    "longirostris": [
-                                        "Harlequin filefish",
-                                        "Longnose filefish",
-                                        "할리퀸파일피쉬",
-                                    ]
-                                },
-                                "Pervagor": {
-                                    "spilosoma": [
-                                        "Fantail filefish",
-                                        "팬테일파일피쉬",
-                                    ],
-                                    "janthinosoma": [
-                                        "Blackbar filefish",
-                                        "블랙바파일피쉬",
-                                    ],
-                                },
-                                "Cantherhines": {
-                                    "dumerilii": [
-                                        "Whitespotted filefish",
-                                        "화이트스팟파일피쉬",
-                                    ],
-                                    "pardalis": [
-                                        "Honeycomb filefish",
-                                        "허니콤파일피쉬",
-                                    ],
-                                    "macrocerus": [
-                                        "Orange filefish",
-                                        "오렌지파일피쉬",
-                                    ],
-                                },
-                            },
-                            "Ostraciidae": {  # 상자고기과 (박스피쉬)
-                                "Ostracion": {
-                                    "cubicus": [
-                                        "Yellow boxfish",
-                                        "옐로우박스피쉬",
-                                    ],
-                                    "meleagris": [
-                                        "Whitespotted boxfish",
-                                        "화이트스팟박스피쉬",
-                                    ],
-                                },
-                                "Lactoria": {
-                                    "cornuta": [
-                                        "Longhorn cowfish",
-                                        "롱혼카우피쉬",
-                                    ],
-                                    "fornasini": [
-                                        "Thornback cowfish",
-                                        "쏜백카우피쉬",
-                                    ],
-                                },
-                                "Lactophrys": {
-                                    "bicaudalis": [
-                                        "Spotted trunkfish",
-                                        "스팟티드트렁크피쉬",
-                                    ],
-                                    "trigonus": [
-                                        "Trunkfish",
-                                        "트렁크피쉬",
-                                    ],
-                                },
-                            },
-                            "Diodontidae": {  # 성게복과 (포큐파인피쉬)
-                                "Diodon": {
-                                    "holocanthus": [
-                                        "Longspined porcupinefish",
-                                        "롱스파인포큐파인피쉬",
-                                    ],
-                                    "hystrix": [
-                                        "Spot-fin porcupinefish",
-                                        "스팟핀포큐파인피쉬",
-                                    ],
-                                    "liturosus": [
-                                        "Black-blotched porcupinefish",
-                                        "블랙블롯치드포큐파인피쉬",
-                                    ],
-                                },
-                                "Chilomycterus": {
-                                    "schoepfii": [
-                                        "Striped burrfish",
-                                        "스트라이프드버피쉬",
-                                    ]
-                                },
-                            },
-                        }
-                    },
-                    "Gobiiformes": {  # 망둑어목
-                        "Gobiidae": {  # 망둑어과 (고비)
-                            "Gobiodon": {
-                                "okinawae": [
-                                    "Yellow coral goby",
-                                    "옐로우코랄고비",
-                                ],
-                                "atrangulatus": [
-                                    "Earspot coral goby",
-                                    "이어스팟코랄고비",
-                                ],
-                                "citrinus": [
-                                    "Citron goby",
-                                    "시트론고비",
-                                ],
-                            },
-                            "Nemateleotris": {
-                                "magnifica": [
-                                    "Fire goby",
-                                    "Firefish",
-                                    "파이어고비",
-                                ],
-                                "decora": [
-                                    "Purple firefish",
-                                    "퍼플파이어피쉬",
-                                ],
-                                "helfrichi": [
-                                    "Helfrich's firefish",
-                                    "헬프리치파이어피쉬",
-                                ],
-                            },
-                            "Valenciennea": {
-                                "puellaris": [
-                                    "Orange-spotted goby",
-                                    "오렌지스팟고비",
-                                ],
-                                "strigata": [
-                                    "Golden-head sleeper goby",
-                                    "골든헤드슬리퍼고비",
-                                ],
-                                "sexguttata": [
-                                    "Sixspot goby",
-                                    "식스스팟고비",
-                                ],
-                                "wardi": [
-                                    "Ward's sleeper goby",
-                                    "워즈슬리퍼고비",
-                                ],
-                            },
-                            "Cryptocentrus": {
-                                "cinctus": [
-                                    "Yellow watchman goby",
-                                    "옐로우와치맨고비",
-                                ],
-                                "pavoninoides": [
-                                    "Blue-spotted watchman goby",
-                                    "블루스팟와치맨고비",
-                                ],
-                                "leptocephalus": [
-                                    "Pink-speckled watchman goby",
-                                    "핑크스페클드와치맨",
-                                ],
-                            },
-                            "Amblyeleotris": {
-                                "steinitzi": [
-                                    "Magnus goby",
-                                    "마그누스고비",
-                                ],
-                                "wheeleri": [
-                                    "Wheeler's shrimp goby",
-                                    "휠러쉬림프고비",
-                                ],
-                                "randalli": [
-                                    "Randall's shrimp goby",
-                                    "랜달쉬림프고비",
-                                ],
-                                "aurora": [
-                                    "Pinkbar goby",
-                                    "핑크바고비",
-                                ],
-                            },
-                            "Elacatinus": {
-                                "oceanops": [
-                                    "Neon goby",
-                                    "네온고비",
-                                ]
-                            },
-                            "Gobiosoma": {
-                                "evelynae": [
-                                    "Sharknose goby",
-                                    "샤크노즈고비",
-                                ]
-                            },
-                            "Stonogobiops": {
-                                "nematodes": [
-                                    "Hi-fin red banded goby",
-                                    "하이핀레드밴디드고비",
-                                ],
-                                "yasha": [
-                                    "Yasha goby",
-                                    "야샤고비",
-                                ],
-                            },
-                            "Koumansetta": {
-                                "rainfordi": [
-                                    "Rainford's goby",
-                                    "레인포드고비",
-                                ],
-                                "hectori": [
-                                    "Hector's goby",
-                                    "헥터고비",
-                                ],
-                            },
-                        },
-                        "Callionymidae": {  # 드래고넷과
-                            "Synchiropus": {
-                                "splendidus": [
-                                    "Mandarin fish",
-                                    "Mandarin dragonet",
-                                    "만다린피쉬",
-                                ],
-                                "picturatus": [
-                                    "Spotted mandarin",
-                                    "Psychedelic mandarin",
-                                    "스팟티드만다린",
-                                ],
-                                "ocellatus": [
-                                    "Scooter blenny",
-                                    "Ocellated dragonet",
-                                    "스쿠터블레니",
-                                ],
-                                "stellatus": [
-                                    "Starry dragonet",
-                                    "스타리드래고넷",
-                                ],
-                                "morrisoni": [
-                                    "Morrison's dragonet",
-                                    "모리슨드래고넷",
-                                ],
-                                "rameus": [
-                                    "Orangespotted dragonet",
-                                    "오렌지스팟드래고넷",
-                                ],
-                                "circularis": [
-                                    "Circular dragonet",
-                                    "서큘러드래고넷",
-                                ],
-                                "moyeri": [
-                                    "Moyer's dragonet",
-                                    "모이어드래고넷",
-                                ],
-                                "rosulentus": [
-                                    "Rosy dragonet",
-                                    "로지드래고넷",
-                                ],
-                            },
-                            "Callionymus": {
-                                "lyra": [
-                                    "Common dragonet",
-                                    "커먼드래고넷",
-                                ],
-                                "bairdi": [
-                                    "Lancer dragonet",
-                                    "랜서드래고넷",
-                                ],
-                                "pusillus": [
-                                    "Small dragonet",
-                                    "스몰드래고넷",
-                                ],
-                                "reticulatus": [
-                                    "Reticulated dragonet",
-                                    "레티큘레이티드드래고넷",
-                                ],
-                            },
-                            "Dactylopus": {
-                                "dactylopus": [
-                                    "Fingered dragonet",
-                                    "핑거드래고넷",
-                                ],
-                            },
-                            "Diplogrammus": {
-                                "pauciradiatus": [
-                                    "Spotted dragonet",
-                                    "스팟티드드래고넷",
-                                ],
-                                "goramensis": [
-                                    "Goram dragonet",
-                                    "고람드래고넷",
-                                ],
-                            },
-                            "Neosynchiropus": {
-                                "ocellatus": [
-                                    "Ocellated dragonet",
-                                    "오셀레이티드드래고넷",
-                                ],
-                            },
-                            "Pterosynchiropus": {
-                                "splendidus": [
-                                    "Splendid dragonet",
-                                    "스플렌디드드래고넷",
-                                ],
-                            },
-                        },
-                        "Microdesmidae": {  # 실고기과
-                            "Ptereleotris": {
-                                "evides": [
-                                    "Blackfin dartfish",
-                                    "블랙핀다트피쉬",
-                                ],
-                                "zebra": [
-                                    "Zebra dartfish",
-                                    "제브라다트피쉬",
-                                ],
-                                "hanae": [
-                                    "Blue hana goby",
-                                    "블루하나고비",
-                                ],
-                            }
-                        },
-                    },
-                    "Syngnathiformes": {  # 실고기목
-                        "Syngnathidae": {  # 해마과
-                            "Hippocampus": {
-                                "kuda": [
-                                    "Yellow seahorse",
-                                    "옐로우해마",
-                                ],
-                                "erectus": [
-                                    "Lined seahorse",
-                                    "라인드해마",
-                                ],
-                                "reidi": [
-                                    "Longsnout seahorse",
-                                    "롱스나웃해마",
-                                ],
-                                "barbouri": [
-                                    "Barbour's seahorse",
-                                    "바버해마",
-                                ],
-                                "comes": [
-                                    "Tiger tail seahorse",
-                                    "타이거테일해마",
-                                ],
-                                "zosterae": [
-                                    "Dwarf seahorse",
-                                    "드워프해마",
-                                ],
-                            },
-                            "Syngnathus": {
-                                "scovelli": [
-                                    "Gulf pipefish",
-                                    "걸프파이프피쉬",
-                                ]
-                            },
-                            "Doryrhamphus": {
-                                "excisus": [
-                                    "Bluestripe pipefish",
-                                    "블루스트라이프파이프피쉬",
-                                ],
-                                "dactyliophorus": [
-                                    "Banded pipefish",
-                                    "밴디드파이프피쉬",
-                                ],
-                                "baliensis": [
-                                    "Bali bluestripe pipefish",
-                                    "발리블루스트라이프",
-                                ],
-                            },
-                            "Corythoichthys": {
-                                "haematopterus": [
-                                    "Messmate pipefish",
-                                    "메스메이트파이프피쉬",
-                                ],
-                                "intestinalis": [
-                                    "Broad-banded pipefish",
-                                    "브로드밴디드파이프피쉬",
-                                ],
-                            },
-                        },
-                        "Nemateleotridae": {  # 다트피쉬과 (Firefish / Dartfish)
-                            "Nemateleotris": {
-                                "decora": [
-                                    "Purple firefish",
-                                    "퍼플파이어피쉬",
-                                ],
-                                "magnifica": [
-                                    "Firefish goby",
-                                    "파이어피쉬고비",
-                                ],
-                                "helfrichi": [
-                                    "Helfrich's firefish",
-                                    "헬프리치파이어피쉬",
-                                ],
-                            },
-                            "Ptereleotris": {
-                                "zebra": [
-                                    "Zebra dartfish",
-                                    "제브라다트피쉬",
-                                ],
-                                "hanae": [
-                                    "Blue gudgeon dartfish",
-                                    "블루구전다트피쉬",
-                                ]
-                            }
-                        }
-                    },
-                    "Scorpaeniformes": {  # 쏨뱅이목
-                        "Scorpaenidae": {  # 쏨뱅이과 (라이언피쉬)
-                            "Pterois": {
-                                "volitans": [
-                                    "Red lionfish",
-                                    "레드라이언피쉬",
-                                ],
-                                "miles": [
-                                    "Devil firefish",
-                                    "데빌파이어피쉬",
-                                ],
-                                "antennata": [
-                                    "Antennata lionfish",
-                                    "안테나타라이언피쉬",
-                                ],
-                                "radiata": [
-                                    "Radial firefish",
-                                    "래디얼파이어피쉬",
-                                ],
-                                "russelli": [
-                                    "Russell's lionfish",
-                                    "러셀라이언피쉬",
-                                ],
-                            },
-                            "Dendrochirus": {
-                                "zebra": [
-                                    "Zebra lionfish",
-                                    "제브라라이언피쉬",
-                                ],
-                                "biocellatus": [
-                                    "Fu manchu lionfish",
-                                    "푸만추라이언피쉬",
-                                ],
-                                "brachypterus": [
-                                    "Dwarf lionfish",
-                                    "드워프라이언피쉬",
-                                ],
-                            },
-                        },
-                    },
-                    "Perciformes": {  # 농어목
-                        "Serranidae": {  # 바리과 (그루퍼, 바슬렛)
-                            "Cephalopholis": {
-                                "miniata": [
-                                    "Coral hind",
-                                    "코랄하인드",
-                                ],
-                                "argus": [
-                                    "Peacock hind",
-                                    "피콕하인드",
-                                ],
-                                "leopardus": [
-                                    "Leopard hind",
-                                    "레오파드하인드",
-                                ],
-                            },
-                            "Epinephelus": {
-                                "fasciatus": [
-                                    "Blacktip grouper",
-                                    "블랙팁그루퍼",
-                                ],
-                                "merra": [
-                                    "Honeycomb grouper",
-                                    "허니콤그루퍼",
-                                ],
-                                "polyphekadion": [
-                                    "Camouflage grouper",
-                                    "카모플라쥬그루퍼",
-                                ],
-                            },
-                            "Cromileptes": {
-                                "altivelis": [
-                                    "Panda grouper",
-                                    "Humpback grouper",
-                                    "Humpback seabass",
-                                    "팬더그루퍼",
-                                    "험프백그루퍼",
-                                ],
-                            },
-                            "Pseudanthias": {
-                                "squamipinnis": [
-                                    "Anthias",
-                                    "Sea goldie",
-                                    "안티아스",
-                                ],
-                                "tuka": [
-                                    "Purple queen",
-                                    "퍼플퀸",
-                                ],
-                                "bicolor": [
-                                    "Bicolor anthias",
-                                    "바이컬러안티아스",
-                                ],
-                                "dispar": [
-                                    "Peach anthias",
-                                    "피치안티아스",
-                                ],
-                                "pleurotaenia": [
-                                    "Square-spot anthias",
-                                    "스퀘어스팟안티아스",
-                                ],
-                                "pictilis": [
-                                    "Pictilis anthias",
-                                    "픽틸리스안티아스",
-                                ],
-                                "smithvanizi": [
-                                    "Resplendent anthias",
-                                    "레스플렌던트안티아스",
-                                ],
-                                "ignitus": [
-                                    "Flame anthias",
-                                    "플레임안티아스",
-                                ],
-                                "evansi": [
-                                    "Evan's anthias",
-                                    "에반스안티아스",
-                                ],
-                                "bartlettorum": [
-                                    "Bartlett's anthias",
-                                    "바틀렛안티아스",
-                                ],
-                                "randalli": [
-                                    "Randall's anthias",
-                                    "랜달안티아스",
-                                ],
-                                "lori": [
-                                    "Lori anthias",
-                                    "로리안티아스",
-                                ],
-                                "fluorescens": [
-                                    "Sunset anthias",
-                                    "선셋안티아스",
-                                ],
-                                # 'parvati'는 현재 유효하지 않고 'bimaculatus'로 통용
-                                "bimaculatus": [
-                                    "Twospot anthias",
-                                    "Two-spot anthias",
-                                    "Bimaculatus anthias",
-                                    "트윈스팟안티아스",
-                                    "투스팟안티아스",
-                                ],
-                            },
-                            "Nemanthias": {
-                                "carberryi": [
-                                    "Threadfin anthias",
-                                    "캐리베리안티아스",
-                                ],
-                            },
-                            "Odontanthias": {
-                                "borbonius": [
-                                    "Borbonius anthias",
-                                    "보르보니우스안티아스",
-                                ],
-                            },
-                            "Tosanoides": {
-                                "flavofasciatus": [
-                                    "Yellow striped anthias",
-                                    "옐로우스트라이프안티아스",
-                                ],
-                            },
-                            "Plectranthias": {
-                                "inermis": [
-                                    "Geometric pygmy perchlet",
-                                    "지오메트릭피그미퍼치렛",
-                                ],
-                                "kelloggi": [
-                                    "Kellogg's perchlet",
-                                    "켈로그퍼치렛",
-                                ],
-                            },
-                            "Liopropoma": {
-                                "rubre": [
-                                    "Peppermint basslet",
-                                    "페퍼민트바슬렛",
-                                ],
-                                "swalesi": [
-                                    "Swales' basslet",
-                                    "스웨일스바슬렛",
-                                ],
-                                "carmabi": [
-                                    "Candy basslet",
-                                    "캔디바슬렛",
-                                ],
-                                # 'suscitatum'는 유효한 학명이 아니므로 제거함
-                                "aberrans": [
-                                    "Aberrant basslet",
-                                    "어버런트바슬렛",
-                                ],
-                            },
-                            "Variola": {
-                                "louti": [
-                                    "Louti grouper",
-                                    "루티그루퍼",
-                                ],
-                            },
-                            "Aethaloperca": {
-                                "rogaa": [
-                                    "Redmouth grouper",
-                                    "레드마우스그루퍼",
-                                ],
-                            },
-                        },
-                        "Lutjanidae": {  # 도미과 (스내퍼)
-                            "Lutjanus": {
-                                "sebae": [
-                                    "Emperor red snapper",
-                                    "엠페러레드스내퍼",
-                                ],
-                                "kasmira": [
-                                    "Common bluestripe snapper",
-                                    "커먼블루스트라이프스내퍼",
-                                ],
-                            }
-                        },
-                        "Caesionidae": {  # 전갱이과
-                            "Caesio": {
-                                "teres": [
-                                    "Yellow and blueback fusilier",
-                                    "옐로우앤블루백퓨질리어",
-                                ]
-                            }
-                        },
-                        "Haemulidae": {  # 석태과 (그런트)
-                            "Plectorhinchus": {
-                                "chaetodonoides": [
-                                    "Harlequin sweetlips",
-                                    "할리퀸스위트립스",
-                                ],
-                                "orientalis": [
-                                    "Oriental sweetlips",
-                                    "오리엔탈스위트립스",
-                                ],
-                            }
-                        },
-                        "Grammatidae": {  # 그라마과
-                            "Gramma": {
-                                "loreto": [
-                                    "Royal gramma",
-                                    "Fairy basslet",
-                                    "로얄그라마",
-                                ],
-                                "melacara": [
-                                    "Blackcap basslet",
-                                    "블랙캡바슬렛",
-                                ],
-                                "brasiliensis": [
-                                    "Brazilian gramma",
-                                    "브라질리언그라마",
-                                ],
-                            }
-                        },
-                        "Pseudochromidae": {  # 닷백과 (데빌피쉬)
-                            "Pseudochromis": {
-                                "fridmani": [
-                                    "Orchid dottyback",
-                                    "Fridman's dottyback",
-                                    "오키드닷백",
-                                ],
-                                "aldabraensis": [
-                                    "Neon dottyback",
-                                    "네온닷백",
-                                ],
-                                "paccagnellae": [
-                                    "False gramma",
-                                    "Royal dottyback",
-                                    "로얄닷백",
-                                ],
-                                "springeri": [
-                                    "Springer's dottyback",
-                                    "스프링거닷백",
-                                ],
-                                "flavivertex": [
-                                    "Sunrise dottyback",
-                                    "선라이즈닷백",
-                                ],
-                            },
-                            "Labracinus": {
-                                "cyclophthalmus": [
-                                    "Firetail devil",
-                                    "파이어테일데빌",
-                                ],
-                            },
-                        },
-                        "Plesiopidae": {  # 롱핀과 (어세서)
-                            "Plesiops": {
-                                "coeruleolineatus": [
-                                    "Crikey fish",
-                                    "Longfin fish",
-                                    "크리키피쉬",
-                                ],
-                                "oxycephalus": [
-                                    "Sharp-headed longfin",
-                                    "샤프헤드롱핀",
-                                ],
-                            },
-                            "Assessor": {
-                                "macneilli": [
-                                    "Blue assessor",
-                                    "Macneill's assessor",
-                                    "블루어세서",
-                                ],
-                                "flavissimus": [
-                                    "Yellow assessor",
-                                    "옐로우어세서",
-                                ],
-                                "randalli": [
-                                    "Randall's assessor",
-                                    "랜달어세서",
-                                ],
-                            },
-                        },
-                        "Holocentridae": {
-                            # 다이얼새우고기과 (Squirrelfish / Soldierfish)
-                            "Sargocentron": {
-                                "diadema": [
-                                    "Crown squirrelfish",
-                                    "크라운스쿼럴피쉬",
-                                ],
-                                "spiniferum": [
-                                    "Sabre squirrelfish",
-                                    "세이버스쿼럴피쉬",
-                                ],
-                            },
-                            "Holocentrus": {
-                                "adscensionis": [
-                                    "Squirrelfish",
-                                    "레드스쿼럴피쉬",
-                                ]
-                            },
-                            "Myripristis": {
-                                # 대표적인 Soldierfish / Bigeye 계열 - 사용자 요청으로 추가
-                                "berndti": [
-                                    "Bigeye soldierfish",
-                                    "빅아이 솔져피쉬",
-                                ],
-                                "murdjan": [
-                                    "Pinecone soldierfish",
-                                    "파인콘 솔져피쉬",
-                                ],
-                            }
-                        },
-                        "Mullidae": {  # 염소고기과 (Goatfish)
-                            "Parupeneus": {
-                                "multifasciatus": [
-                                    "Manybar goatfish",
-                                    "메니바르고트피쉬",
-                                ],
-                                "porphyreus": [
-                                    "Red goatfish",
-                                    "레드고트피쉬",
-                                ],
-                            },
-                            "Upeneus": {
-                                "tragula": [
-                                    "Freckled goatfish",
-                                    "프레클드고트피쉬",
-                                ]
-                            }
-                        },
-                        "Malacanthidae": {  # 타일피쉬과 (Tilefish)
-                            "Hoplolatilus": {
-                                "chlupatyi": [
-                                    "Flashing tilefish",
-                                    "플래싱타일피쉬",
-                                ],
-                                "fourmanoiri": [
-                                    "Purple tilefish",
-                                    "퍼플타일피쉬",
-                                ],
-                            }
-                        },
-                        "Sphyraenidae": {  # 바라쿠다과 (소형 juvenile 제한적 관상)
-                            "Sphyraena": {
-                                "barras": [
-                                    "Barracuda (juvenile)",
-                                    "주니어바라쿠다",
-                                ]
-                            }
-                        },
-                        "Aulostomidae": {  # 트럼펫피쉬과
-                            "Aulostomus": {
-                                "chinensis": [
-                                    "Chinese trumpetfish",
-                                    "차이니스트럼펫피쉬",
-                                ],
-                                "strigosus": [
-                                    "Atlantic trumpetfish",
-                                    "애틀랜틱트럼펫피쉬",
-                                ]
-                            }
-                        },
-                        "Fistulariidae": {  # 코르넷피쉬과
-                            "Fistularia": {
-                                "commersonii": [
-                                    "Bluespotted cornetfish",
-                                    "블루스팟코넷피쉬",
-                                ]
-                            }
-                        },
-                    },
-                    "Anguilliformes": {  # 뱀장어목
-                        "Muraenidae": {  # 곰치과 (모레이일)
-                            "Gymnothorax": {
-                                "tesselata": [
-                                    "Honeycomb moray",
-                                    "허니콤모레이",
-                                ],
-                                "flavimarginatus": [
-                                    "Yellow-edged moray",
-                                    "옐로우에지드모레이",
-                                ],
-                                "undulatus": [
-                                    "Undulated moray",
-                                    "언둘레이티드모레이",
-                                ],
-                                "javanicus": [
-                                    "Giant moray",
-                                    "자이언트모레이",
-                                ],
-                                "melatremus": [
-                                    "Golden dwarf moray",
-                                    "골든드워프모레이",
-                                ],
-                            },
-                            "Rhinomuraena": {
-                                "quaesita": [
-                                    "Ribbon eel",
-                                    "리본일",
-                                ]
-                            },
-                            "Echidna": {
-                                "nebulosa": [
-                                    "Snowflake moray",
-                                    "스노우플레이크모레이",
-                                ]
-                            },
-                            # Gymnomuraena zebra 유지 (Gymnothorax 중복 제거)
-                            "Gymnomuraena": {
-                                "zebra": [
-                                    "Zebra moray",
-                                    "제브라모레이",
-                                ]
-                            },
-                        },
-                        "Ophichthidae": {  # 뱀장어과
-                            "Myrichthys": {
-                                "colubrinus": [
-                                    "Harlequin snake eel",
-                                    "할리퀸스네이크일",
-                                ]
-                            }
-                        },
-                    },
-                    "Pleuronectiformes": {  # 가자미목 (일부 관상용 플랫피쉬)
-                        "Bothidae": {  # 넙치과 (Left-eyed flounders)
-                            "Bothus": {
-                                "lunatus": [
-                                    "Peacock flounder",
-                                    "피콕플라운더",
-                                ]
-                            }
-                        },
-                        "Paralichthyidae": {  # 넙칫과 (Sand flounders)
-                            "Paralichthys": {
-                                "olivaceus": [
-                                    "Olive flounder",
-                                    "올리브플라운더",
-                                ]
-                            }
-                        },
-                        "Soleidae": {  # 넙치목 솔레
-                            "Zebrias": {
-                                "fasciatus": [
-                                    "Zebra sole",
-                                    "제브라솔",
-                                ]
-                            }
-                        },
-                        # 주의: 다수 가자미류는 대형/식용 위주이므로 최소 대표종만 포함
-                    },
-                    "Lophiiformes": {  # 아귀목
-                        "Antennariidae": {  # 아귀과 (프로그피쉬)
-                            "Antennarius": {
-                                "maculatus": [
-                                    "Warty frogfish",
-                                    "워티프로그피쉬",
-                                ],
-                                "striatus": [
-                                    "Striated frogfish",
-                                    "스트라이에이티드프로그피쉬",
-                                ],
-                                "pictus": [
-                                    "Painted frogfish",
-                                    "페인티드프로그피쉬",
-                                ],
-                            }
-                        }
-                    },
-                }
-            },
-        }
+        # 기본 분류 체계는 클래스 캐시를 공유하고, 병합 시에만 복사한다
+        self.fish_taxonomy = self._load_default_taxonomy(classes)
+        self._taxonomy_shared = True
 
-        # 외부 파일에서 분류 체계 로드 (있는 경우)
-        if taxonomy_file:
-            self.load_taxonomy_from_file(taxonomy_file)
 
     # 과(Family) 태그 지정:
     # 'core'     : 핵심 관상어
@@ -3452,255 +350,612 @@ class TaxonomyManager:
         # 인덱스 생성
         self._build_indexes()
 
+        # 외부 파일에서 분류 체계 로드 (있는 경우, 인덱스에 증분 반영)
+        if taxonomy_file:
+            self.load_taxonomy_from_file(taxonomy_file)
+
+    @staticmethod
+    def _load_default_taxonomy(
+        classes: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """패키지에 포함된 기본 분류 체계 로드 (강별 파일을 프로세스당 한 번만 파싱)"""
+        data_files = _taxonomy_data_files()
+        if classes is None:
+            classes = list(data_files)
+
+        cache = TaxonomyManager._CLASS_TAXONOMY_CACHE
+        for class_name in classes:
+            if class_name in cache:
+                continue
+            if class_name not in data_files:
+                raise ValueError(f"알 수 없는 강(class): {class_name}")
+            data = data_files[class_name].read_bytes()
+            # 공유 데이터이므로 일반명 목록은 튜플로 고정 (더 작고 실수로 수정 불가)
+            cache[class_name] = _intern_taxonomy(
+                orjson.loads(data) if orjson is not None else json.loads(data),
+                {},
+                tuple,
+            )
+
+        return {class_name: cache[class_name] for class_name in classes}
+
     def _build_indexes(self):
         """검색 성능을 위한 인덱스 생성"""
-        self.species_index: Dict[str, SpeciesInfo] = {}
+        self.species_index: Dict[Tuple[str, str], SpeciesInfo] = {}
         self.genus_index: Dict[str, List[SpeciesInfo]] = {}
         self.family_index: Dict[Tuple[str, str, str], List[SpeciesInfo]] = {}
         self.common_name_index: Dict[str, List[SpeciesInfo]] = {}
 
-        # Chondrichthyes 처리
         try:
-            chondrichthyes = self.fish_taxonomy.get("Chondrichthyes", {})
-            for order_name, order_data in chondrichthyes.items():
-                if not isinstance(order_data, dict):
-                    continue
-                for family_name, family_data in order_data.items():
-                    if not isinstance(family_data, dict):
-                        continue
-                    for genus_name, genus_data in family_data.items():
-                        if not isinstance(genus_data, dict):
-                            continue
-                        for species_name, common_names in genus_data.items():
-                            if isinstance(common_names, list):
-                                species_info = SpeciesInfo(
-                                    genus=genus_name,
-                                    species=species_name,
-                                    common_names=common_names,
-                                    family=family_name,
-                                    order=order_name,
-                                    class_name="Chondrichthyes",
-                                )
-                                self._add_to_indexes(species_info)
+            # 같은 종이 트리의 여러 위치에 있으면 행은 하나만 만든다.
+            # 행 순서는 첫 위치, 계층은 마지막 위치를 따르고 일반명은 등록 순서대로 합친다.
+            entries: Dict[Tuple[str, str], Tuple[str, str, str, List[str]]] = {}
+            for (
+                class_name, order_name, family_name, genus_name, species_name, common_names
+            ) in _iter_flat(self.fish_taxonomy):
+                genus_name = _GENUS_ALIASES.get(genus_name, genus_name)
+                previous = entries.get((genus_name, species_name))
+                if previous is not None:
+                    # 상세 보고는 validate_taxonomy()가 담당하므로 생성 시에는 디버그로만 기록
+                    self.logger.debug(
+                        f"중복 등록된 종: {genus_name} {species_name} "
+                        f"({'/'.join(previous[:3])} -> "
+                        f"{class_name}/{order_name}/{family_name})"
+                    )
+                    common_names = list(dict.fromkeys((*previous[3], *common_names)))
+                entries[(genus_name, species_name)] = (
+                    class_name, order_name, family_name, common_names
+                )
+
+            for (genus_name, species_name), (
+                class_name, order_name, family_name, common_names
+            ) in entries.items():
+                self._add_to_indexes(
+                    self._create_species_info(
+                        genus_name,
+                        species_name,
+                        common_names,
+                        family_name,
+                        order_name,
+                        class_name,
+                    )
+                )
         except Exception as e:
-            self.logger.error(f"Chondrichthyes 인덱스 생성 오류: {e}")
+            self.logger.error(f"분류 체계 인덱스 생성 오류: {e}")
 
-        # Osteichthyes 처리
-        try:
-            osteichthyes = self.fish_taxonomy.get("Osteichthyes", {})
-            actinopterygii = osteichthyes.get("Actinopterygii", {})
+        # 여러 종이 같이 쓰는 일반명은 단일 조회 시 먼저 등록된 종을 사용
+        shared_names = [
+            key for key, species in self.common_name_index.items() if len(species) > 1
+        ]
+        if shared_names:
+            self.logger.debug(
+                f"여러 종이 같이 쓰는 일반명 {len(shared_names)}개 "
+                f"(먼저 등록된 종 우선): {', '.join(shared_names)}"
+            )
 
-            # 재귀적으로 모든 레벨 처리
-            self._process_osteichthyes_data(actinopterygii, "Osteichthyes")
-            
-        except Exception as e:
-            self.logger.error(f"Osteichthyes 인덱스 생성 오류: {e}")
+        self._finalize_indexes()
 
         self.logger.info(f"분류 체계 인덱스 생성 완료: {len(self.species_index)}종")
 
-    def _process_osteichthyes_data(self, data, class_name):
-        """Osteichthyes 데이터 재귀 처리"""
-        def find_families_recursive(current_data: Dict[str, Any]):
-            """재귀적으로 모든 과(Family) 찾기"""
-            for key, value in current_data.items():
-                if not isinstance(value, dict):
-                    continue
-                
-                # 과(Family) 감지 - 'idae'로 끝나는 것
-                if key.endswith('idae'):
-                    # 과를 찾았으면 상위 목(order) 찾기
-                    order_name = self._find_order_name(data, key)
-                    self._process_family_data(
-                        value,
-                        key,
-                        order_name,
-                        class_name,
-                    )
-                else:
-                    # 과가 아니면 더 깊이 탐색
-                    find_families_recursive(value)
-        
-        # 재귀 탐색 시작
-        find_families_recursive(data)
-    
-    def _find_order_name(
-        self, root_data: Dict[str, Any], family_name: str
-    ) -> str:
-        """특정 과가 속한 목(order) 이름 찾기"""
-        def search_order(
-            data: Dict[str, Any], path: List[str] = []
-        ) -> Optional[str]:
-            for key, value in data.items():
-                if not isinstance(value, dict):
-                    continue
-                
-                current_path = path + [key]
-                
-                # 현재 레벨에서 찾는 과를 발견
-                if family_name in value:
-                    # 경로에서 'formes' 또는 'ales'로 끝나는 목 찾기
-                    for p in reversed(current_path):
-                        if p.endswith('formes') or p.endswith('ales'):
-                            return p
-                    # 'formes'/'ales'가 없으면 마지막 레벨을 목으로 간주
-                    return current_path[-1] if current_path else "Unknown"
-                
-                # 재귀 탐색
-                result = search_order(value, current_path)
-                if result:
-                    return result
-            
-            return None
-        
-        result = search_order(root_data)
-        return result or "Unknown"
-    
-    def _is_family_with_genera(self, family_data):
-        """과 데이터가 직접 속을 포함하는지 확인"""
-        for key, value in family_data.items():
-            if isinstance(value, dict):
-                # 속 데이터인지 확인 (종 데이터를 포함하는지)
-                for subkey, subvalue in value.items():
-                    if isinstance(subvalue, list):  # 종의 일반명 리스트
-                        return True
-        return False
+    def _create_species_info(
+        self,
+        genus_name: str,
+        species_name: str,
+        common_names: List[str],
+        family_name: str,
+        order_name: str,
+        class_name: str,
+    ) -> SpeciesInfo:
+        """계급명과 일반명을 intern 하여 SpeciesInfo 생성
 
-    def _process_family_data(
-        self, family_data, family_name, order_name, class_name
-    ):
-        """과 데이터 처리 (아과 구조 지원)"""
-        for key, value in family_data.items():
-            if not isinstance(value, dict):
-                continue
-            
-            # 아과인지 속인지 판단
-            # 아과는 보통 'inae'로 끝나고, 그 안에 속들이 있음
-            if key.endswith('inae'):
-                # 아과 구조 - 재귀적으로 처리
-                self._process_family_data(
-                    value, family_name, order_name, class_name
-                )
-            else:
-                # 속 구조 - 직접 처리
-                genus_name = key
-                genus_data = value
-                if isinstance(genus_data, dict):
-                    for species_name, common_names in genus_data.items():
-                        if isinstance(common_names, list):
-                            species_info = SpeciesInfo(
-                                genus=genus_name,
-                                species=species_name,
-                                common_names=common_names,
-                                family=family_name,
-                                order=order_name,
-                                class_name=class_name,
-                            )
-                            self._add_to_indexes(species_info)
+        같은 과/속 이름과 일반명이 여러 종과 인덱스에 반복되므로
+        하나의 문자열 객체를 공유하도록 한다.
+        속명 오기(_GENUS_ALIASES)는 정식 속명으로 바꿔 같은 종으로 합친다.
+        """
+        intern = sys.intern
+        return SpeciesInfo(
+            genus=intern(_GENUS_ALIASES.get(genus_name, genus_name)),
+            species=intern(species_name),
+            common_names=[intern(name) for name in common_names],
+            family=intern(family_name),
+            order=intern(order_name),
+            class_name=intern(class_name),
+        )
 
     def _add_to_indexes(self, species_info: SpeciesInfo):
         """종 정보를 인덱스에 추가"""
-        # 학명 인덱스
-        scientific_name = species_info.scientific_name
-        self.species_index[scientific_name] = species_info
+        # 학명 인덱스 ((genus, species) 키)
+        self.species_index[(species_info.genus, species_info.species)] = species_info
 
         # 속 인덱스
-        if species_info.genus not in self.genus_index:
-            self.genus_index[species_info.genus] = []
-        self.genus_index[species_info.genus].append(species_info)
+        self.genus_index.setdefault(species_info.genus, []).append(species_info)
 
         # 과 인덱스
-        family_key = (
-            species_info.class_name,
-            species_info.order,
-            species_info.family,
+        self.family_index.setdefault(
+            (species_info.class_name, species_info.order, species_info.family), []
+        ).append(species_info)
+
+        # 일반명 인덱스 (대소문자만 다른 이름은 한 번만 등록)
+        for key in dict.fromkeys(map(_common_name_key, species_info.common_names)):
+            self.common_name_index.setdefault(sys.intern(key), []).append(species_info)
+
+    def _index_species(
+        self,
+        class_name: str,
+        order_name: str,
+        family_name: str,
+        genus_name: str,
+        species_name: str,
+        common_names: List[str],
+    ):
+        """병합된 종 하나를 기존 인덱스에 증분 반영
+
+        이미 있는 종은 일반명만 합치고 계층은 바꾸지 않는다.
+        """
+        genus_name = _GENUS_ALIASES.get(genus_name, genus_name)
+        existing = self.species_index.get((genus_name, species_name))
+        if existing is None:
+            species_info = self._create_species_info(
+                genus_name,
+                species_name,
+                common_names,
+                family_name,
+                order_name,
+                class_name,
+            )
+            self._add_to_indexes(species_info)
+            self._append_row(species_info)
+            return
+
+        # 이미 있는 종은 일반명만 갱신 (SpeciesInfo는 불변이므로 교체)
+        # 다른 계층으로 병합된 경우에도 기존 강/목/과는 유지한다.
+        if (class_name, order_name, family_name) != (
+            existing.class_name, existing.order, existing.family
+        ):
+            self.logger.warning(
+                f"다른 계층으로 병합된 종 {existing.scientific_name}: "
+                f"{class_name}/{order_name}/{family_name} 무시, 기존 계층 유지 "
+                f"({existing.class_name}/{existing.order}/{existing.family})"
+            )
+        common_names = list(dict.fromkeys(existing.common_names + common_names))
+        species_info = replace(existing, common_names=common_names)
+        self.species_index[(genus_name, species_name)] = species_info
+
+        def swap(entries: List[SpeciesInfo]):
+            for pos, entry in enumerate(entries):
+                if entry is existing:
+                    entries[pos] = species_info
+
+        swap(self.genus_index[existing.genus])
+        swap(self.family_index[(existing.class_name, existing.order, existing.family)])
+
+        old_keys = {_common_name_key(name) for name in existing.common_names}
+        for key in dict.fromkeys(map(_common_name_key, common_names)):
+            key = sys.intern(key)
+            if key in old_keys:
+                swap(self.common_name_index[key])
+                old_keys.discard(key)
+            else:
+                self.common_name_index.setdefault(key, []).append(species_info)
+        for key in old_keys:
+            swap(self.common_name_index[key])
+
+    def _index_merged_species(
+        self, merged_species: List[Tuple[Tuple[str, ...], List[str]]]
+    ):
+        """병합으로 추가/변경된 종만 인덱스에 반영"""
+        if not merged_species:
+            return
+
+        self._thaw_indexes()
+        for path, common_names in merged_species:
+            ranks = _resolve_ranks(path)
+            if ranks is None:
+                continue
+            class_name, order_name, family_name, genus_name = ranks
+            self._index_species(
+                class_name, order_name, family_name, genus_name, path[-1], common_names
+            )
+        self._flatten_common_names()
+
+        self._freeze_indexes()
+        self._refresh_caches()
+
+    def _flatten(self):
+        """종 단위 평면 배열(SoA) 생성
+
+        i번째 종의 계층 정보는 각 ID 배열의 i번째 값으로 표현되며,
+        ID는 해당 계급의 이름 테이블(_class_names 등) 인덱스이다.
+        행 순서는 species_index(및 get_all_species) 순서와 같다.
+        """
+        self._class_names: List[str] = []
+        self._order_names: List[str] = []
+        self._family_names: List[str] = []
+        self._genus_names: List[str] = []
+        self._class_vocab: Dict[str, int] = {}
+        self._order_vocab: Dict[str, int] = {}
+        self._family_vocab: Dict[str, int] = {}
+        self._genus_vocab: Dict[str, int] = {}
+
+        self._class_ids = array("H")
+        self._order_ids = array("H")
+        self._family_ids = array("H")
+        self._genus_ids = array("H")
+        self._species_names: List[str] = []
+        self._scientific_rows: Dict[str, int] = {}
+
+        for species_info in self.species_index.values():
+            self._append_row(species_info)
+        self._flatten_common_names()
+
+    def _flatten_common_names(self):
+        """일반명 열을 CSR 형태로 생성
+
+        i번째 종의 일반명은
+        _common_names_flat[_common_name_offsets[i]:_common_name_offsets[i + 1]] 이다.
+        """
+        self._common_names_flat: List[str] = []
+        self._common_name_offsets = array("I", [0])
+        for species_info in self.species_index.values():
+            self._common_names_flat.extend(species_info.common_names)
+            self._common_name_offsets.append(len(self._common_names_flat))
+
+    def _append_row(self, species_info: SpeciesInfo):
+        """평면 배열에 종 한 행 추가"""
+        def encode(name: str, vocab: Dict[str, int], names: List[str]) -> int:
+            rank_id = vocab.get(name)
+            if rank_id is None:
+                rank_id = vocab[name] = len(names)
+                names.append(name)
+            return rank_id
+
+        self._class_ids.append(
+            encode(species_info.class_name, self._class_vocab, self._class_names)
+        )
+        self._order_ids.append(
+            encode(species_info.order, self._order_vocab, self._order_names)
+        )
+        self._family_ids.append(
+            encode(species_info.family, self._family_vocab, self._family_names)
+        )
+        self._genus_ids.append(
+            encode(species_info.genus, self._genus_vocab, self._genus_names)
+        )
+        self._scientific_rows[species_info.scientific_name] = len(self._species_names)
+        self._species_names.append(species_info.species)
+
+    def _row(self, row: int) -> SpeciesInfo:
+        """평면 배열의 한 행으로부터 SpeciesInfo 생성"""
+        return self._create_species_info(
+            self._genus_names[self._genus_ids[row]],
+            self._species_names[row],
+            self._common_names_flat[
+                self._common_name_offsets[row]:self._common_name_offsets[row + 1]
+            ],
+            self._family_names[self._family_ids[row]],
+            self._order_names[self._order_ids[row]],
+            self._class_names[self._class_ids[row]],
+        )
+
+    def _finalize_indexes(self):
+        """인덱스 구성 후 평면 배열과 조회 결과 캐시 생성
+
+        캐시된 튜플은 호출자 간에 공유되므로 수정하지 않아야 한다.
+        """
+        self._flatten()
+
+        self._freeze_indexes()
+        self._refresh_caches()
+
+    def _freeze_indexes(self):
+        """인덱스를 읽기 전용 매핑 + 튜플 값으로 고정"""
+        self.species_index: Mapping[Tuple[str, str], SpeciesInfo] = MappingProxyType(
+            dict(self.species_index)
+        )
+        self.genus_index: Mapping[str, Tuple[SpeciesInfo, ...]] = _freeze_index(
+            self.genus_index
+        )
+        self.family_index: Mapping[
+            Tuple[str, str, str], Tuple[SpeciesInfo, ...]
+        ] = _freeze_index(self.family_index)
+        self.common_name_index: Mapping[
+            str, Tuple[SpeciesInfo, ...]
+        ] = _freeze_index(self.common_name_index)
+
+    def _thaw_indexes(self):
+        """증분 갱신을 위해 인덱스를 수정 가능한 dict + 리스트 값으로 복원"""
+        self.species_index = dict(self.species_index)
+        self.genus_index = {
+            key: list(entries) for key, entries in self.genus_index.items()
+        }
+        self.family_index = {
+            key: list(entries) for key, entries in self.family_index.items()
+        }
+        self.common_name_index = {
+            key: list(entries) for key, entries in self.common_name_index.items()
+        }
+
+    def _refresh_caches(self):
+        """조회 결과 캐시 재생성"""
+        self._all_species_cache: Tuple[SpeciesInfo, ...] = tuple(
+            self.species_index.values()
+        )
+
+        # 목(Order) 우선 정렬, 같은 목 내에서는 과(Family) 알파벳 순
+        self._all_families_cache: Tuple[Tuple[str, str, str], ...] = tuple(
+            sorted(
+                (
+                    (
+                        self._class_names[class_id],
+                        self._order_names[order_id],
+                        self._family_names[family_id],
+                    )
+                    for class_id, order_id, family_id in self._iter_family_keys()
+                ),
+                key=lambda x: (x[1].lower(), x[2].lower()),
+            )
+        )
+        self._ornamental_families_cache: Optional[
+            Tuple[Tuple[str, str, str], ...]
+        ] = None
+        self._statistics_cache: Optional[Dict[str, Any]] = None
+
+        # 공백을 무시한 일반명 키 -> 실제 인덱스 키 (띄어쓰기가 다른 검색어 대응)
+        self._compact_name_keys: Dict[str, str] = {}
+        for key in self.common_name_index:
+            self._compact_name_keys.setdefault(_compact_name_key(key), key)
+
+        # 인덱스가 바뀌면 이전 검색 결과가 무효이므로 인스턴스별 캐시를 새로 생성
+        self._search_cache = lru_cache(maxsize=_SEARCH_CACHE_SIZE)(
+            self._lookup_common_name
         )
-        if family_key not in self.family_index:
-            self.family_index[family_key] = []
-        self.family_index[family_key].append(species_info)
+        # numpy 사본은 첫 벡터 필터 호출 시 생성 (array 원본은 증분 추가를 위해 유지)
+        self._rank_id_vectors: Optional[Tuple[Any, Any, Any]] = None
+        # 본문 일반명 매처는 첫 find_species_in_text 호출 시 생성
+        self._name_matcher: Optional[Callable[[str], Iterator[str]]] = None
+        # 정렬된 일반명 키 목록은 첫 접두어 검색 시 생성
+        self._sorted_name_keys: Optional[List[str]] = None
 
-        # 일반명 인덱스
-        for common_name in species_info.common_names:
-            common_lower = common_name.lower()
-            if common_lower not in self.common_name_index:
-                self.common_name_index[common_lower] = []
-            self.common_name_index[common_lower].append(species_info)
+    def _iter_family_keys(self):
+        """평면 배열에서 (class_id, order_id, family_id) 고유 조합을 등장 순서대로 반환"""
+        return dict.fromkeys(
+            zip(self._class_ids, self._order_ids, self._family_ids)
+        )
+
+    def clear_caches(self) -> None:
+        """지연 생성되는 조회 캐시 비우기 (검색 LRU, 본문 매처, 통계 등)
+
+        인덱스 자체는 유지되며, 각 캐시는 다음 조회 시 다시 만들어진다.
+        """
+        self._search_cache.cache_clear()
+        self._name_matcher = None
+        self._sorted_name_keys = None
+        self._rank_id_vectors = None
+        self._ornamental_families_cache = None
+        self._statistics_cache = None
 
     def get_species_info(
         self, genus: str, species: str
     ) -> Optional[SpeciesInfo]:
-        """종 정보 조회"""
-        scientific_name = f"{genus} {species}"
-        return self.species_index.get(scientific_name)
+        """종 정보 조회 (속명 오기도 정식 속명으로 조회)"""
+        return self.species_index.get((_GENUS_ALIASES.get(genus, genus), species))
+
+    def get_species_by_scientific_name(
+        self, scientific_name: str
+    ) -> Optional[SpeciesInfo]:
+        """학명("Genus species")으로 종 정보 조회 (속명 오기도 정식 속명으로 조회)"""
+        row = self._scientific_rows.get(scientific_name)
+        if row is None:
+            genus, _, species = scientific_name.partition(" ")
+            if genus not in _GENUS_ALIASES:
+                return None
+            row = self._scientific_rows.get(f"{_GENUS_ALIASES[genus]} {species}")
+        return None if row is None else self._all_species_cache[row]
+
+    def get_species_info_batch(
+        self, pairs: List[Tuple[str, str]]
+    ) -> List[Optional[SpeciesInfo]]:
+        """여러 (genus, species) 쌍을 한 번에 조회 (입력 순서대로 결과 반환)"""
+        lookup = self.species_index.get
+        results = [lookup(pair) for pair in pairs]
+        for i, (genus, species) in enumerate(pairs):
+            if results[i] is None and genus in _GENUS_ALIASES:
+                results[i] = lookup((_GENUS_ALIASES[genus], species))
+        return results
 
     def get_common_names(self, genus: str, species: str) -> List[str]:
         """일반명 목록 반환"""
         species_info = self.get_species_info(genus, species)
         return species_info.common_names if species_info else []
 
-    def search_by_common_name(self, common_name: str) -> List[SpeciesInfo]:
-        """일반명으로 종 검색"""
-        common_lower = common_name.lower()
-        return self.common_name_index.get(common_lower, [])
+    def search_by_common_name(
+        self, common_name: str
+    ) -> Tuple[SpeciesInfo, ...]:
+        """일반명으로 종 검색 (반복 조회는 LRU 캐시에서 반환)"""
+        return self._search_cache(common_name)
+
+    def get_species_by_common_name(self, common_name: str) -> Optional[SpeciesInfo]:
+        """일반명으로 종 하나 조회 (여러 종이 같이 쓰는 이름이면 먼저 등록된 종)"""
+        entries = self._search_cache(common_name)
+        return entries[0] if entries else None
+
+    def search_by_common_names_batch(
+        self, common_names: List[str]
+    ) -> List[Tuple[SpeciesInfo, ...]]:
+        """여러 일반명을 한 번에 검색 (입력 순서대로 결과 반환)"""
+        search = self._search_cache
+        return [search(name) for name in common_names]
+
+    def _lookup_common_name(self, common_name: str) -> Tuple[SpeciesInfo, ...]:
+        """정규화된 일반명 키로 인덱스 조회 (캐시되지 않은 원본 조회)
+
+        정확히 일치하는 키가 없으면 공백을 제거한 키로 한 번 더 찾는다.
+        """
+        key = _common_name_key(common_name)
+        entries = self.common_name_index.get(key)
+        if entries is None:
+            compact_key = self._compact_name_keys.get(_compact_name_key(key))
+            entries = self.common_name_index[compact_key] if compact_key else ()
+        return entries
+
+    def search_by_common_name_prefix(
+        self, prefix: str, limit: int = 20
+    ) -> List[SpeciesInfo]:
+        """일반명 접두어로 종 검색 (일반명 키 사전순, 중복 제거, 최대 limit종)
+
+        정렬된 일반명 키 목록에서 이분 탐색으로 시작 위치를 찾으므로
+        전체 이름을 훑지 않고 일치하는 범위만 읽는다.
+        """
+        key = _common_name_key(prefix)
+        if not key or limit <= 0:
+            return []
+        if self._sorted_name_keys is None:
+            self._sorted_name_keys = sorted(self.common_name_index)
+
+        keys = self._sorted_name_keys
+        index = self.common_name_index
+        found: Dict[Tuple[str, str], SpeciesInfo] = {}
+        for pos in range(bisect_left(keys, key), len(keys)):
+            name_key = keys[pos]
+            if not name_key.startswith(key):
+                break
+            for species_info in index[name_key]:
+                found.setdefault((species_info.genus, species_info.species), species_info)
+                if len(found) >= limit:
+                    return list(found.values())
+        return list(found.values())
+
+    def find_species_in_text(self, text: str) -> List[SpeciesInfo]:
+        """본문에 포함된 일반명을 모두 찾아 해당 종 반환 (첫 등장 순서, 중복 제거)"""
+        if self._name_matcher is None:
+            self._name_matcher = self._build_name_matcher()
+
+        found: Dict[Tuple[str, str], SpeciesInfo] = {}
+        # 매치 수만큼 반복되는 루프이므로 속성/메서드 조회를 지역 변수로 고정
+        index = self.common_name_index
+        add = found.setdefault
+        for key in self._name_matcher(_common_name_key(text)):
+            for species_info in index[key]:
+                add((species_info.genus, species_info.species), species_info)
+        return list(found.values())
+
+    def _build_name_matcher(self) -> Callable[[str], Iterator[str]]:
+        """모든 일반명 키를 한 번에 찾는 매처 생성
+
+        단어 경계에 놓인 일반명 중 왼쪽부터 가장 긴 것을 겹치지 않게 찾아
+        일반명 키를 순서대로 반환한다. pyahocorasick이 있으면 Aho-Corasick
+        오토마톤의 전체 일치 결과에서 고르고, 없으면 긴 이름 우선의 정규식
+        alternation을 사용한다. 두 방식의 결과는 같다.
+        """
+        keys = [key for key in self.common_name_index if key]
+        if not keys:
+            return lambda text: iter(())
+
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for key in keys:
+                automaton.add_word(key, key)
+            automaton.make_automaton()
+
+            def match(text: str) -> Iterator[str]:
+                # (시작 위치, -길이) 순으로 정렬하면 정규식의 leftmost-longest 선택과 같아짐
+                spans = sorted(
+                    (end + 1 - len(key), -len(key), key)
+                    for end, key in automaton.iter(text)
+                    if _on_word_boundary(text, end + 1 - len(key), end + 1)
+                )
+                position = 0
+                for start, negative_length, key in spans:
+                    if start >= position:
+                        position = start - negative_length
+                        yield key
+
+            return match
+
+        pattern = re.compile(
+            "|".join(_bounded_pattern(key) for key in sorted(keys, key=len, reverse=True))
+        )
+        return lambda text: (match.group() for match in pattern.finditer(text))
 
     def get_species_by_family(
         self, class_name: str, order_name: str, family_name: str
     ) -> List[Tuple[str, str]]:
         """특정 과의 모든 종 반환 (genus, species)"""
-        species_list = []
+        class_id = self._class_vocab.get(class_name)
+        order_id = self._order_vocab.get(order_name)
+        family_id = self._family_vocab.get(family_name)
+        if class_id is None or order_id is None or family_id is None:
+            return []
 
-        # 해당 과의 모든 종 찾기
-        for species_info in self.species_index.values():
-            if (
-                species_info.class_name == class_name
-                and species_info.order == order_name
-                and species_info.family == family_name
-            ):
-                species_list.append((species_info.genus, species_info.species))
+        genus_names = self._genus_names
+        genus_ids = self._genus_ids
+        species_names = self._species_names
+        np = _numpy()
+        if np is not None:
+            if self._rank_id_vectors is None:
+                self._rank_id_vectors = tuple(
+                    np.array(ids, dtype=np.uint16)
+                    for ids in (self._class_ids, self._order_ids, self._family_ids)
+                )
+            class_ids, order_ids, family_ids = self._rank_id_vectors
+            rows = np.flatnonzero(
+                (family_ids == family_id)
+                & (order_ids == order_id)
+                & (class_ids == class_id)
+            ).tolist()
+        else:
+            rows = [
+                row
+                for row, ids in enumerate(
+                    zip(self._class_ids, self._order_ids, self._family_ids)
+                )
+                if ids == (class_id, order_id, family_id)
+            ]
+        return [(genus_names[genus_ids[row]], species_names[row]) for row in rows]
 
-        return species_list
+    def iter_species_by_family(
+        self, tile_size: int = 256
+    ) -> Iterator[Tuple[Tuple[str, str, str], Tuple[SpeciesInfo, ...]]]:
+        """과 단위로 묶은 종 목록을 순서대로 반환 ((class, order, family), 종 튜플)
+
+        get_all_families(ornamental_only=False) 순서를 따르며,
+        tile_size보다 큰 과는 여러 묶음으로 나누어 반환한다.
+        tile_size가 1보다 작으면 호출 즉시 ValueError를 발생시킨다.
+        """
+        if tile_size < 1:
+            raise ValueError(f"tile_size must be at least 1: {tile_size}")
 
-    def get_species_by_genus(self, genus_name: str) -> List[SpeciesInfo]:
-        """속명으로 종 목록 반환"""
-        return self.genus_index.get(genus_name, [])
+        def tiles():
+            for family_key in self._all_families_cache:
+                entries = self.family_index.get(family_key, ())
+                for start in range(0, len(entries), tile_size):
+                    yield family_key, entries[start:start + tile_size]
+
+        return tiles()
+
+    def get_species_by_genus(self, genus_name: str) -> Tuple[SpeciesInfo, ...]:
+        """속명으로 종 목록 반환 (속명 오기도 정식 속명으로 조회)"""
+        return self.genus_index.get(_GENUS_ALIASES.get(genus_name, genus_name), ())
 
     def get_all_families(
         self, ornamental_only: bool = True
-    ) -> List[Tuple[str, str, str]]:
+    ) -> Tuple[Tuple[str, str, str], ...]:
         """과 목록 반환 (class, order, family)
 
         ornamental_only=True 이면 family_tags 에서 'exclude' 로 표시된 과는 제외.
         확장(ex. extended) 과도 포함(일반적으로 사육 가능). 향후 필요 시 파라미터 추가 가능.
+        반환되는 튜플은 캐시된 값이므로 수정하지 말 것.
         """
-        families: List[Tuple[str, str, str]] = []
-
-        def include_family(family_name: str) -> bool:
-            if not ornamental_only:
-                return True
-            tag = self.family_tags.get(family_name, "core")
-            return tag != "exclude"
-
-        # Chondrichthyes 처리
-        chondrichthyes = self.fish_taxonomy.get("Chondrichthyes", {})
-        for order_name, order_data in chondrichthyes.items():
-            if isinstance(order_data, dict):
-                for family_name, family_data in order_data.items():
-                    if (
-                        isinstance(family_data, dict)
-                        and include_family(family_name)
-                    ):
-                        families.append(
-                            ("Chondrichthyes", order_name, family_name)
-                        )
-
-        # Osteichthyes 처리 - family_index 사용 (이미 인덱스에 존재하는 것만)
-        for family_key, _species_list in self.family_index.items():
-            class_name, order_name, family_name = family_key
-            if class_name == "Osteichthyes" and include_family(family_name):
-                families.append((class_name, order_name, family_name))
+        if not ornamental_only:
+            return self._all_families_cache
 
-        # 목(Order) 우선 정렬, 같은 목 내에서는 과(Family) 알파벳 순
-        families.sort(key=lambda x: (x[1].lower(), x[2].lower()))
-        return families
+        if self._ornamental_families_cache is None:
+            self._ornamental_families_cache = tuple(
+                family_key
+                for family_key in self._all_families_cache
+                if self.family_tags.get(family_key[2], "core") != "exclude"
+            )
+        return self._ornamental_families_cache
 
     def is_family_excluded(self, family_name: str) -> bool:
         """관상어 필터에서 제외되는 과인지 여부"""
@@ -3711,73 +966,150 @@ class TaxonomyManager:
         if tag not in ("core", "extended", "exclude"):
             raise ValueError("tag must be one of: core, extended, exclude")
         self.family_tags[family_name] = tag
+        self._ornamental_families_cache = None
         self.logger.info(f"과 태그 변경: {family_name} -> {tag}")
 
-    def get_all_species(self) -> List[SpeciesInfo]:
-        """모든 종 정보 반환"""
-        return list(self.species_index.values())
+    def get_all_species(self) -> Tuple[SpeciesInfo, ...]:
+        """모든 종 정보 반환 (캐시된 튜플이므로 수정하지 말 것)"""
+        return self._all_species_cache
+
+    def create_directory_structure(
+        self, base_dir: Path, max_workers: int = 32
+    ) -> None:
+        """분류학적 계층에 따른 종별 디렉토리 구조 생성
 
-    def create_directory_structure(self, base_dir: Path) -> None:
-        """완전한 분류학적 계층에 따른 디렉토리 구조 생성"""
-        base_dir.mkdir(exist_ok=True)
+        base_dir/class/order/family/Genus_species 형태로 생성하며,
+        mkdir 호출은 I/O 대기 위주이므로 스레드 풀에서 병렬로 처리한다.
+        """
+        base_dir.mkdir(parents=True, exist_ok=True)
 
-        def create_recursive_dirs(current_dict, current_path):
-            """재귀적으로 디렉토리 구조 생성"""
-            for key, value in current_dict.items():
-                new_path = current_path / key
-                new_path.mkdir(exist_ok=True)
+        # 중간 Path 객체 없이 문자열 경로를 만들어 os.makedirs에 바로 전달
+        base_path = str(base_dir)
+        join = os.path.join
+        class_names = self._class_names
+        order_names = self._order_names
+        family_names = self._family_names
+        genus_names = self._genus_names
+        species_dirs = [
+            join(
+                base_path,
+                class_names[class_id],
+                order_names[order_id],
+                family_names[family_id],
+                f"{genus_names[genus_id]}_{species_name}",
+            )
+            for class_id, order_id, family_id, genus_id, species_name in zip(
+                self._class_ids,
+                self._order_ids,
+                self._family_ids,
+                self._genus_ids,
+                self._species_names,
+            )
+        ]
+
+        def make_dir(path: str) -> None:
+            os.makedirs(path, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # 결과를 소비해야 작업 중 발생한 예외가 전파됨
+            list(executor.map(make_dir, species_dirs))
 
-                if isinstance(value, dict):
-                    # 아직 더 깊은 계층이 있음
-                    if any(isinstance(v, dict) for v in value.values()):
-                        create_recursive_dirs(value, new_path)
-                    else:
-                        # 속(genus) 레벨에 도달 - 종별 폴더 생성
-                        for genus_name, species_dict in value.items():
-                            genus_path = new_path / genus_name
-                            genus_path.mkdir(exist_ok=True)
-
-                            for species_name in species_dict.keys():
-                                species_dir = (
-                                    genus_path / f"{genus_name}_{species_name}"
-                                )
-                                species_dir.mkdir(exist_ok=True)
-
-        create_recursive_dirs(self.fish_taxonomy, base_dir)
         self.logger.info(f"완전한 분류학적 디렉토리 구조 생성 완료: {base_dir}")
 
     def get_taxonomy_statistics(self) -> Dict[str, Any]:
         """완전한 분류 체계 통계 반환"""
-        total_species = len(self.species_index)
-        total_genera = len(self.genus_index)
-        total_families = len(self.family_index)
+        if self._statistics_cache is None:
+            # 평면 배열을 한 번만 순회하며 강별 종 수와 과 조합을 함께 집계
+            class_counts: Dict[int, int] = {}
+            family_keys = set()
+            for family_key in zip(self._class_ids, self._order_ids, self._family_ids):
+                class_counts[family_key[0]] = class_counts.get(family_key[0], 0) + 1
+                family_keys.add(family_key)
 
-        class_stats = {}
-        for species_info in self.species_index.values():
-            class_name = species_info.class_name
-            if class_name not in class_stats:
-                class_stats[class_name] = 0
-            class_stats[class_name] += 1
+            self._statistics_cache = {
+                "total_species": len(self._species_names),
+                "total_genera": len(self._genus_names),
+                "total_families": len(family_keys),
+                "total_classes": len(class_counts),
+                "class_distribution": {
+                    self._class_names[class_id]: count
+                    for class_id, count in class_counts.items()
+                },
+            }
+
+        # 호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본 반환
+        stats = dict(self._statistics_cache)
+        stats["class_distribution"] = dict(stats["class_distribution"])
+        return stats
+
+    def validate_taxonomy(self) -> Dict[str, Dict[str, List[str]]]:
+        """분류 데이터 중복 검사
+
+        duplicate_keys: 패키지 데이터 파일의 같은 객체 안에 중복된 키 (강 -> 키 목록)
+        duplicate_species: 트리의 여러 위치에 등록된 종 ("Genus species" -> 과 경로 목록)
+        shared_common_names: 둘 이상의 종이 같이 쓰는 일반명 (검색 키 -> 학명 목록)
+        중복 키는 로드 시 조용히 덮어써지므로 오류로, 중복 종은 경고로 기록한다.
+        (중복 종은 인덱스에서 한 행으로 합쳐지고 마지막 위치의 계층을 따른다)
+        """
+        duplicate_keys = {}
+        for class_name, data_file in _taxonomy_data_files().items():
+            keys = _find_duplicate_keys(data_file.read_bytes())
+            if keys:
+                duplicate_keys[class_name] = keys
+                self.logger.error(
+                    f"분류 데이터 파일 중복 키: {class_name}.json ({', '.join(keys)})"
+                )
+
+        species_paths: Dict[str, List[str]] = defaultdict(list)
+        for (
+            class_name, order_name, family_name, genus_name, species_name, _
+        ) in _iter_flat(self.fish_taxonomy):
+            species_paths[f"{genus_name} {species_name}"].append(
+                f"{class_name}/{order_name}/{family_name}"
+            )
+        duplicate_species = {
+            name: paths for name, paths in species_paths.items() if len(paths) > 1
+        }
+
+        shared_common_names = {}
+        for key, entries in self.common_name_index.items():
+            scientific_names = list(
+                dict.fromkeys(species_info.scientific_name for species_info in entries)
+            )
+            if len(scientific_names) > 1:
+                shared_common_names[key] = scientific_names
+
+        for name, paths in duplicate_species.items():
+            self.logger.warning(f"중복 등록된 종: {name} ({', '.join(paths)})")
 
         return {
-            "total_species": total_species,
-            "total_genera": total_genera,
-            "total_families": total_families,
-            "total_classes": len(class_stats),
-            "class_distribution": class_stats,
+            "duplicate_keys": duplicate_keys,
+            "duplicate_species": duplicate_species,
+            "shared_common_names": shared_common_names,
         }
 
     def export_taxonomy(self, file_path: str) -> bool:
         """분류 체계를 파일로 내보내기"""
         try:
             export_data = {
-                "export_date": datetime.now().isoformat(),
+                "export_date": datetime.now(),
                 "statistics": self.get_taxonomy_statistics(),
                 "taxonomy": self.fish_taxonomy,
             }
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                # orjson은 datetime을 직접 ISO 형식으로 직렬화
+                with open(file_path, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            export_data,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
+                    )
+            else:
+                export_data["export_date"] = export_data["export_date"].isoformat()
+                with open(file_path, "w", encoding="utf-8") as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False)
 
             self.logger.info(f"분류 체계 내보내기 완료: {file_path}")
             return True
@@ -3786,22 +1118,49 @@ class TaxonomyManager:
             self.logger.error(f"분류 체계 내보내기 실패: {e}")
             return False
 
+    def export_species_ndjson(self, file_path: str) -> bool:
+        """종 목록을 한 줄에 한 종씩 NDJSON으로 내보내기
+
+        중간 리스트 없이 종마다 바로 직렬화해 기록하므로 메모리 사용이 일정하다.
+        """
+        try:
+            with open(file_path, "wb") as f:
+                for species_info in self._all_species_cache:
+                    f.write(species_info.to_json_bytes())
+                    f.write(b"\n")
+
+            self.logger.info(f"종 목록 NDJSON 내보내기 완료: {file_path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"종 목록 NDJSON 내보내기 실패: {e}")
+            return False
+
     @handle_gracefully(default_return=False)
     def load_taxonomy_from_file(self, file_path: str) -> bool:
-        """외부 파일에서 분류 체계 로드"""
+        """외부 파일에서 분류 체계 로드
+
+        기존 체계에 병합하며, 이미 있는 종은 일반명만 추가된다.
+        같은 종이 다른 강/목/과 아래에 있으면 기존 계층을 유지하고 경고를 남긴다.
+        """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(file_path, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
 
             # 분류 체계 데이터 추출
             if "taxonomy" in data:
                 external_taxonomy = data["taxonomy"]
             else:
                 external_taxonomy = data
+            external_taxonomy = _intern_taxonomy(external_taxonomy, {})
 
-            # 기존 분류 체계와 병합
-            self._merge_taxonomy(external_taxonomy)
-            self._build_indexes()
+            # 기존 분류 체계와 병합 후 변경된 종만 인덱스에 반영
+            merged_species = self._merge_taxonomy(external_taxonomy)
+            self._index_merged_species(merged_species)
 
             self.logger.info(f"외부 분류 체계 로드 완료: {file_path}")
             return True
@@ -3810,10 +1169,211 @@ class TaxonomyManager:
             self.logger.error(f"분류 체계 파일 로드 실패: {e}")
             return False
 
-    def _merge_taxonomy(self, external_taxonomy: Dict):
-        """외부 분류 체계를 기존 체계와 병합"""
-        # 간단한 병합 로직 (실제로는 더 복잡할 수 있음)
-        for class_name, class_data in external_taxonomy.items():
-            if class_name not in self.fish_taxonomy:
-                self.fish_taxonomy[class_name] = class_data
-            # 더 세밀한 병합 로직은 필요에 따라 구현
+    def save(self, file_path: str) -> bool:
+        """인덱스가 구성된 상태를 스냅샷 파일로 저장
+
+        평면 배열과 일반명 인덱스(행 번호)를 그대로 저장하므로
+        load() 시 분류 트리를 다시 순회하지 않는다.
+        """
+        try:
+            row_of = {key: row for row, key in enumerate(self.species_index)}
+            snapshot = {
+                "version": _SNAPSHOT_VERSION,
+                "fish_taxonomy": self.fish_taxonomy,
+                "family_tags": self.family_tags,
+                "class_names": self._class_names,
+                "order_names": self._order_names,
+                "family_names": self._family_names,
+                "genus_names": self._genus_names,
+                "class_ids": self._class_ids,
+                "order_ids": self._order_ids,
+                "family_ids": self._family_ids,
+                "genus_ids": self._genus_ids,
+                "species_names": self._species_names,
+                "common_names_flat": self._common_names_flat,
+                "common_name_offsets": self._common_name_offsets,
+                "common_name_rows": {
+                    key: [
+                        row_of[(species_info.genus, species_info.species)]
+                        for species_info in entries
+                    ]
+                    for key, entries in self.common_name_index.items()
+                },
+                "extra": self._snapshot_extra(),
+            }
+
+            file_path = Path(file_path)
+            temp_file = file_path.with_suffix(".tmp")
+            with open(temp_file, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            temp_file.replace(file_path)
+
+            self.logger.info(f"분류 체계 스냅샷 저장 완료: {file_path}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"분류 체계 스냅샷 저장 실패: {e}")
+            return False
+
+    @classmethod
+    def load(cls, file_path: str) -> Optional["TaxonomyManager"]:
+        """save()로 저장한 스냅샷에서 관리자 복원"""
+        logger = get_logger("taxonomy_manager")
+        try:
+            with open(file_path, "rb") as f:
+                snapshot = pickle.load(f)
+
+            if snapshot.get("version") != _SNAPSHOT_VERSION:
+                logger.warning(f"지원하지 않는 스냅샷 버전: {file_path}")
+                return None
+
+            manager = cls.__new__(cls)
+            manager.logger = logger
+            manager.error_handler = get_error_handler()
+            manager.fish_taxonomy = snapshot["fish_taxonomy"]
+            manager.family_tags = snapshot["family_tags"]
+            manager._restore_snapshot(snapshot)
+
+            logger.info(f"분류 체계 스냅샷 로드 완료: {file_path}")
+            return manager
+
+        except Exception as e:
+            logger.error(f"분류 체계 스냅샷 로드 실패: {e}")
+            return None
+
+    @classmethod
+    def from_cache(cls, cache_dir: Optional[str] = None) -> "TaxonomyManager":
+        """기본 분류 체계로 구성한 관리자를 디스크 스냅샷 캐시에서 로드
+
+        캐시 디렉토리는 cache_dir 또는 환경 변수 MARINE_FISH_TAXONOMY_CACHE로
+        호출자가 지정해야 하며, 둘 다 없으면 캐시 없이 새로 구성한다.
+        스냅샷은 pickle이므로 신뢰할 수 있는(다른 사용자가 쓸 수 없는) 디렉토리만 지정할 것.
+        캐시 키는 분류 데이터 파일과 클래스 정의 모듈 내용의 해시이므로,
+        데이터나 인덱스 로직이 바뀌면 자동으로 새로 구성해 저장한다.
+        """
+        cache_dir = cache_dir or os.environ.get(_CACHE_DIR_ENV)
+        if not cache_dir:
+            return cls()
+
+        cache_dir = Path(cache_dir)
+        digest = hashlib.blake2b(digest_size=8)
+        for data_file in _taxonomy_data_files().values():
+            digest.update(data_file.read_bytes())
+        for module_file in dict.fromkeys(
+            (__file__, sys.modules[cls.__module__].__file__)
+        ):
+            digest.update(Path(module_file).read_bytes())
+        cache_file = cache_dir / (
+            f"{cls.__name__}_v{_SNAPSHOT_VERSION}_{digest.hexdigest()}.pkl"
+        )
+
+        if cache_file.exists():
+            manager = cls.load(str(cache_file))
+            if manager is not None:
+                return manager
+
+        manager = cls()
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            manager.save(str(cache_file))
+        except OSError as e:
+            manager.logger.warning(f"분류 체계 캐시 디렉토리 생성 실패: {e}")
+        return manager
+
+    def _snapshot_extra(self) -> Dict[str, Any]:
+        """하위 클래스 전용 상태 (스냅샷에 함께 저장)"""
+        return {}
+
+    def _restore_snapshot(self, snapshot: Dict[str, Any]):
+        """스냅샷의 평면 배열로부터 인덱스 재구성"""
+        self._class_names = snapshot["class_names"]
+        self._order_names = snapshot["order_names"]
+        self._family_names = snapshot["family_names"]
+        self._genus_names = snapshot["genus_names"]
+        self._class_vocab = {name: i for i, name in enumerate(self._class_names)}
+        self._order_vocab = {name: i for i, name in enumerate(self._order_names)}
+        self._family_vocab = {name: i for i, name in enumerate(self._family_names)}
+        self._genus_vocab = {name: i for i, name in enumerate(self._genus_names)}
+        self._class_ids = snapshot["class_ids"]
+        self._order_ids = snapshot["order_ids"]
+        self._family_ids = snapshot["family_ids"]
+        self._genus_ids = snapshot["genus_ids"]
+        self._species_names = snapshot["species_names"]
+        self._common_names_flat = snapshot["common_names_flat"]
+        self._common_name_offsets = snapshot["common_name_offsets"]
+
+        rows = [self._row(row) for row in range(len(self._species_names))]
+        self._scientific_rows = {
+            species_info.scientific_name: row for row, species_info in enumerate(rows)
+        }
+        self.species_index = {
+            (species_info.genus, species_info.species): species_info
+            for species_info in rows
+        }
+        self.genus_index = {}
+        self.family_index = {}
+        for species_info in rows:
+            self.genus_index.setdefault(species_info.genus, []).append(species_info)
+            self.family_index.setdefault(
+                (species_info.class_name, species_info.order, species_info.family), []
+            ).append(species_info)
+
+        self.common_name_index = {
+            key: [rows[row] for row in row_ids]
+            for key, row_ids in snapshot["common_name_rows"].items()
+        }
+
+        for name, value in snapshot["extra"].items():
+            setattr(self, name, value)
+
+        self._freeze_indexes()
+        self._refresh_caches()
+
+    def _merge_taxonomy(
+        self, external_taxonomy: Dict
+    ) -> List[Tuple[Tuple[str, ...], List[str]]]:
+        """외부 분류 체계를 기존 체계와 병합
+
+        계층(dict)은 재귀적으로 병합하고, 종 단위 일반명 목록은
+        기존 순서를 유지한 채 중복 없이 합친다.
+        속명 오기(_GENUS_ALIASES) 계층은 정식 속명 계층으로 합친다.
+        트리에는 외부 경로가 그대로 추가되지만, 인덱스에 이미 있는 종의
+        계층은 _index_species()에서 기존 값을 유지한다.
+        새로 추가되었거나 일반명이 늘어난 종의 (경로, 일반명 목록)을 반환한다.
+        """
+        merged_species: List[Tuple[Tuple[str, ...], List[str]]] = []
+
+        def merge_level(
+            target: Dict[str, Any], source: Dict[str, Any], path: Tuple[str, ...]
+        ):
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    # 속명 오기는 정식 속명 계층으로 합치고,
+                    # 없는 계층은 빈 dict로 만든 뒤 같은 방식으로 채움
+                    key = _GENUS_ALIASES.get(key, key)
+                    child = target.setdefault(key, {})
+                    if isinstance(child, dict):
+                        merge_level(child, value, path + (key,))
+                    continue
+
+                existing = target.setdefault(key, value)
+                if not isinstance(value, list):
+                    continue
+                if existing is value:
+                    merged_species.append((path + (key,), value))
+                elif isinstance(existing, (list, tuple)):
+                    # 기존 일반명이 없으면 새 목록을 그대로 사용
+                    # (기본 데이터의 일반명은 튜플이므로 리스트로 합침)
+                    names = (
+                        list(dict.fromkeys((*existing, *value))) if existing else value
+                    )
+                    if names != list(existing):
+                        target[key] = names
+                        merged_species.append((path + (key,), names))
+
+        if self._taxonomy_shared:
+            # 공유 중인 기본 분류 체계는 수정 전에 인스턴스 전용으로 복사
+            self.fish_taxonomy = copy.deepcopy(self.fish_taxonomy)
+            self._taxonomy_shared = False
+        merge_level(self.fish_taxonomy, external_taxonomy, ())
+        return merged_species
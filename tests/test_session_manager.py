@@ -0,0 +1,105 @@
+"""SessionManager 진행 로그(NDJSON) 테스트"""
+import json
+
+import pytest
+
+from marine_fish.session_manager import SessionManager
+from marine_fish.taxonomy_manager import SpeciesInfo
+
+
+@pytest.fixture
+def species():
+    return [
+        SpeciesInfo(
+            genus="Amphiprion",
+            species=name,
+            common_names=[f"{name} clownfish"],
+            family="Pomacentridae",
+            order="Ovalentaria",
+            class_name="Osteichthyes",
+        )
+        for name in ("ocellaris", "percula", "clarkii")
+    ]
+
+
+def _read_session_file(sessions_dir, session_id):
+    with open(sessions_dir / f"session_{session_id}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_progress_log_replay_and_compaction(tmp_path, species):
+    """진행 로그의 마지막 레코드가 로드 시 반영되고 전체 저장 시 로그가 비워짐"""
+    manager = SessionManager(str(tmp_path))
+    session = manager.create_session(species, images_per_species=5)
+    log_file = manager._get_log_file(session.session_id)
+
+    manager.update_current_session_progress(1, 5)
+    manager.update_current_session_progress(2, 10)
+    assert len(log_file.read_bytes().splitlines()) == 2
+    # 진행 상황은 로그에만 추가되고 세션 파일은 다시 쓰지 않음
+    assert _read_session_file(tmp_path, session.session_id)["completed_species"] == 0
+
+    reloaded = SessionManager(str(tmp_path)).load_session(session.session_id)
+    assert reloaded.completed_species == 2
+    assert reloaded.total_downloaded == 10
+    assert reloaded.status == "running"
+    # 로드 시 로그를 세션 파일로 합치고 비움
+    assert _read_session_file(tmp_path, session.session_id)["total_downloaded"] == 10
+    assert log_file.read_bytes() == b""
+
+
+def test_save_session_truncates_progress_log(tmp_path, species):
+    """전체 저장 후에는 진행 로그가 비어 있음"""
+    manager = SessionManager(str(tmp_path))
+    session = manager.create_session(species, images_per_species=5)
+    log_file = manager._get_log_file(session.session_id)
+
+    manager.update_current_session_progress(1, 4)
+    assert log_file.read_bytes()
+    assert manager.save_session(session)
+    assert log_file.read_bytes() == b""
+    assert _read_session_file(tmp_path, session.session_id)["total_downloaded"] == 4
+
+
+def test_corrupt_trailing_line_is_ignored(tmp_path, species):
+    """기록 도중 끊긴 마지막 줄은 무시하고 직전 유효 레코드를 사용"""
+    manager = SessionManager(str(tmp_path))
+    session = manager.create_session(species, images_per_species=5)
+    manager.update_current_session_progress(1, 3)
+    manager.update_current_session_progress(2, 7)
+    manager._close_progress_log()
+    with open(manager._get_log_file(session.session_id), "ab") as f:
+        f.write(b'{"t": 1.0, "c": 3, "d"')
+
+    other = SessionManager(str(tmp_path))
+    assert other.list_sessions()[0]["total_downloaded"] == 7
+    reloaded = other.load_session(session.session_id)
+    assert (reloaded.completed_species, reloaded.total_downloaded) == (2, 7)
+
+
+def test_list_sessions_skips_records_without_id(tmp_path, species):
+    """session_id가 없는 세션 파일은 목록에서 제외"""
+    manager = SessionManager(str(tmp_path))
+    session = manager.create_session(species, images_per_species=5)
+    (tmp_path / "session_broken.json").write_text(
+        json.dumps({"status": "running"}), encoding="utf-8"
+    )
+
+    sessions = manager.list_sessions()
+    assert [info["session_id"] for info in sessions] == [session.session_id]
+
+
+@pytest.mark.parametrize("finish", ["complete", "fail"])
+def test_finished_session_does_not_open_progress_log(tmp_path, species, finish):
+    """완료/실패한 세션을 로드해도 진행 로그를 열지 않음"""
+    manager = SessionManager(str(tmp_path))
+    session = manager.create_session(species, images_per_species=5)
+    if finish == "complete":
+        assert manager.complete_session(session.session_id)
+    else:
+        assert manager.fail_session(session.session_id, "network error")
+
+    other = SessionManager(str(tmp_path))
+    reloaded = other.load_session(session.session_id)
+    assert reloaded.status in ("completed", "failed")
+    assert other._log_fd is None
@@ -0,0 +1,354 @@
+"""TaxonomyManager 테스트"""
+import json
+import unicodedata
+
+import pytest
+
+from marine_fish import taxonomy_manager
+from marine_fish.coral_taxonomy_manager import CoralTaxonomyManager
+from marine_fish.taxonomy_manager import (
+    TaxonomyManager,
+    _find_duplicate_keys,
+    _taxonomy_data_files,
+)
+
+
+@pytest.fixture(scope="module")
+def manager():
+    return TaxonomyManager()
+
+
+def _regex_matcher(manager, monkeypatch):
+    monkeypatch.setattr(taxonomy_manager, "ahocorasick", None)
+    return manager._build_name_matcher()
+
+
+def test_find_species_in_text_longest_match(manager, monkeypatch):
+    """긴 일반명이 그 안에 포함된 짧은 일반명보다 우선"""
+    found = manager.find_species_in_text("papuan epaulette shark")
+    assert [info.scientific_name for info in found] == ["Hemiscyllium hallstromi"]
+
+    match = _regex_matcher(manager, monkeypatch)
+    assert list(match("papuan epaulette shark")) == ["papuan epaulette shark"]
+
+
+def test_find_species_in_text_word_boundary(manager):
+    """영문 이름은 단어 경계에서만, 한글 이름은 조사가 붙어도 일치"""
+    assert manager.find_species_in_text("yellow tangerine") == []
+    found = manager.find_species_in_text("솔론페어리를 샀다")
+    assert [info.scientific_name for info in found] == ["Cirrhilabrus solorensis"]
+
+
+@pytest.mark.skipif(
+    taxonomy_manager.ahocorasick is None, reason="pyahocorasick 미설치"
+)
+def test_name_matcher_backends_agree(manager, monkeypatch):
+    """Aho-Corasick 매처와 정규식 매처의 결과가 같음"""
+    automaton_match = manager._build_name_matcher()
+    regex_match = _regex_matcher(manager, monkeypatch)
+
+    keys = [key for key in manager.common_name_index if key]
+    texts = keys + [" ".join(keys[i:i + 3]) for i in range(0, len(keys), 3)]
+    for text in texts:
+        assert list(automaton_match(text)) == list(regex_match(text)), text
+
+
+def test_search_by_common_name_prefix(manager):
+    """접두어 검색은 일치하는 범위의 종만 중복 없이 limit개까지 반환"""
+    assert manager.search_by_common_name_prefix("") == []
+    assert manager.search_by_common_name_prefix("\uffff") == []
+    assert manager.search_by_common_name_prefix("blue", limit=0) == []
+
+    found = manager.search_by_common_name_prefix("blue", limit=500)
+    assert found
+    assert len({info.scientific_name for info in found}) == len(found)
+    for info in found:
+        assert any(name.casefold().startswith("blue") for name in info.common_names)
+    assert manager.search_by_common_name_prefix("blue", limit=3) == found[:3]
+
+    # 자모가 분리된(NFD) 한글 입력도 정규화되어 같은 결과를 반환
+    korean = manager.search_by_common_name_prefix("블루")
+    assert korean
+    assert manager.search_by_common_name_prefix(unicodedata.normalize("NFD", "블루")) == korean
+
+
+def test_validate_taxonomy_reports_no_duplicates(manager):
+    """패키지 분류 데이터에 중복 키나 여러 위치에 등록된 종이 없음"""
+    report = manager.validate_taxonomy()
+    assert report["duplicate_keys"] == {}
+    assert report["duplicate_species"] == {}
+
+    scientific_names = [info.scientific_name for info in manager.get_all_species()]
+    assert len(set(scientific_names)) == len(scientific_names)
+    assert len(manager.species_index) == len(scientific_names)
+    assert "purple tang" not in report["shared_common_names"]
+
+    magnifica = manager.get_species_info("Nemateleotris", "magnifica")
+    assert magnifica.family == "Nemateleotridae"
+    assert magnifica.primary_common_name == "Firefish goby"
+    assert manager.search_by_common_name("fire goby") == (magnifica,)
+
+
+def test_duplicate_species_merged_into_one_row():
+    """여러 위치에 등록된 종은 보고되고 인덱스에는 한 행으로 합쳐짐"""
+    manager = TaxonomyManager()
+    manager.fish_taxonomy = {
+        "Osteichthyes": {
+            "Actinopterygii": {
+                "Gobiiformes": {
+                    "Gobiidae": {"Nemateleotris": {"magnifica": ["Fire dartfish"]}}
+                },
+                "Syngnathiformes": {
+                    "Nemateleotridae": {
+                        "Nemateleotris": {"magnifica": ["Firefish goby"]}
+                    }
+                },
+            }
+        }
+    }
+    manager._build_indexes()
+
+    report = manager.validate_taxonomy()
+    assert report["duplicate_species"]["Nemateleotris magnifica"] == [
+        "Osteichthyes/Gobiiformes/Gobiidae",
+        "Osteichthyes/Syngnathiformes/Nemateleotridae",
+    ]
+    assert len(manager.get_all_species()) == len(manager.species_index) == 1
+    magnifica = manager.get_species_info("Nemateleotris", "magnifica")
+    assert magnifica.family == "Nemateleotridae"
+    assert magnifica.common_names == ["Fire dartfish", "Firefish goby"]
+    assert manager.search_by_common_name("fire dartfish") == (magnifica,)
+
+
+def test_shared_common_name_prefers_earliest_species(manager):
+    """여러 종이 같이 쓰는 일반명은 먼저 등록된 종을 단일 조회 결과로 사용"""
+    matches = manager.search_by_common_name("Yellowtail surgeonfish")
+    assert len(matches) > 1
+    assert manager.get_species_by_common_name("Yellowtail surgeonfish") == matches[0]
+    assert matches[0].scientific_name == "Zebrasoma xanthurum"
+
+
+def test_iter_species_by_family_tiles(manager):
+    """과별 묶음은 tile_size 이하로 나뉘고 전체 종을 빠짐없이 포함"""
+    tiles = list(manager.iter_species_by_family(tile_size=4))
+    assert all(1 <= len(species) <= 4 for _, species in tiles)
+    assert sum(len(species) for _, species in tiles) == len(manager.get_all_species())
+
+    with pytest.raises(ValueError, match="tile_size"):
+        manager.iter_species_by_family(tile_size=0)
+
+
+def test_bundled_taxonomy_has_no_duplicate_keys():
+    """패키지 분류 데이터 파일에 같은 객체 안의 중복 키가 없음
+
+    일반 JSON 파싱은 중복 키를 마지막 값으로 조용히 덮어쓰므로 여기서 막는다.
+    """
+    data_files = _taxonomy_data_files()
+    assert data_files
+    for class_name, data_file in data_files.items():
+        assert _find_duplicate_keys(data_file.read_bytes()) == [], class_name
+
+
+def test_find_duplicate_keys():
+    """중첩된 객체의 중복 키도 찾음"""
+    data = b'{"Labridae": {"Cirrhilabrus": {}, "Cirrhilabrus": {}}, "Gobiidae": {}}'
+    assert _find_duplicate_keys(data) == ["Cirrhilabrus"]
+
+
+def test_merge_folds_genus_alias(tmp_path):
+    """속명 오기로 병합한 종은 기존 정식 속명 종에 합쳐지고 조회가 일관됨"""
+    manager = TaxonomyManager()
+    labridae_path = ["Osteichthyes", "Actinopterygii", "Acanthuromorpha",
+                     "Acanthuriformes", "Labridae"]
+    original = manager.get_species_info("Cirrhilabrus", "solorensis")
+
+    external = {"Cirrihilabrus": {"solorensis": ["X"]}, "Newgenus": {"novus": ["Y"]}}
+    for rank in reversed(labridae_path):
+        external = {rank: external}
+    taxonomy_file = tmp_path / "extra.json"
+    taxonomy_file.write_text(json.dumps(external), encoding="utf-8")
+    assert manager.load_taxonomy_from_file(str(taxonomy_file))
+
+    solorensis = manager.get_species_info("Cirrhilabrus", "solorensis")
+    assert solorensis.common_names == [*original.common_names, "X"]
+    assert manager.get_species_info("Cirrihilabrus", "solorensis") == solorensis
+    assert manager.search_by_common_name("X") == (solorensis,)
+    genus_species = [info.species for info in manager.get_species_by_genus("Cirrhilabrus")]
+    assert genus_species.count("solorensis") == 1
+
+    node = manager.fish_taxonomy
+    for rank in labridae_path:
+        node = node[rank]
+    assert "Cirrihilabrus" not in node
+
+    assert len(manager.get_all_species()) == len(manager.species_index)
+    novus = manager.get_species_by_scientific_name("Newgenus novus")
+    assert novus is not None and novus.family == "Labridae"
+    assert ("Newgenus", "novus") in manager.get_species_by_family(
+        "Osteichthyes", "Acanthuriformes", "Labridae"
+    )
+
+
+def test_incremental_merge_updates_all_indexes(tmp_path):
+    """새 속, 속명 오기, 기존 종의 추가 일반명이 모든 조회 경로에 반영됨"""
+    manager = TaxonomyManager()
+    labridae = ("Osteichthyes", "Acanthuriformes", "Labridae")
+    existing = manager.get_species_info("Elacatinus", "oceanops")
+    gobiidae = (existing.class_name, existing.order, existing.family)
+
+    external = {
+        "Osteichthyes": {
+            "Actinopterygii": {
+                "Acanthuromorpha": {
+                    "Acanthuriformes": {
+                        "Labridae": {
+                            "Newgenus": {"novus": ["Novel wrasse"]},
+                            "Cirrihilabrus": {"aliasensis": ["Alias wrasse"]},
+                        }
+                    }
+                },
+                "Gobiiformes": {
+                    "Gobiidae": {"Elacatinus": {"oceanops": ["Merged neon goby"]}}
+                },
+            }
+        }
+    }
+    taxonomy_file = tmp_path / "extra.json"
+    taxonomy_file.write_text(json.dumps(external), encoding="utf-8")
+    assert manager.load_taxonomy_from_file(str(taxonomy_file))
+
+    expected = [
+        ("Newgenus novus", "Novel wrasse", labridae),
+        ("Cirrhilabrus aliasensis", "Alias wrasse", labridae),
+        ("Elacatinus oceanops", "Merged neon goby", gobiidae),
+    ]
+    for scientific_name, common_name, family_key in expected:
+        info = manager.get_species_by_scientific_name(scientific_name)
+        assert info is not None, scientific_name
+        assert manager.search_by_common_name(common_name) == (info,)
+        assert manager.genus_index[info.genus].count(info) == 1
+        assert manager.family_index[family_key].count(info) == 1
+
+    oceanops = manager.get_species_by_scientific_name("Elacatinus oceanops")
+    assert oceanops.common_names == [*existing.common_names, "Merged neon goby"]
+    assert manager.search_by_common_name(existing.primary_common_name) == (oceanops,)
+    assert len(manager.get_all_species()) == len(manager.species_index)
+
+
+def test_merge_under_other_family_keeps_existing_family(tmp_path, caplog):
+    """다른 과로 병합된 기존 종은 기존 계층을 유지하고 경고를 남김"""
+    manager = TaxonomyManager()
+    existing = manager.get_species_info("Elacatinus", "oceanops")
+    external = {
+        "Osteichthyes": {
+            "Actinopterygii": {
+                "Acanthuromorpha": {
+                    "Acanthuriformes": {
+                        "Labridae": {"Elacatinus": {"oceanops": ["Misplaced goby"]}}
+                    }
+                }
+            }
+        }
+    }
+    taxonomy_file = tmp_path / "extra.json"
+    taxonomy_file.write_text(json.dumps(external), encoding="utf-8")
+    with caplog.at_level("WARNING"):
+        assert manager.load_taxonomy_from_file(str(taxonomy_file))
+
+    oceanops = manager.get_species_info("Elacatinus", "oceanops")
+    assert oceanops.family == existing.family
+    assert manager.search_by_common_name("Misplaced goby") == (oceanops,)
+    assert "기존 계층 유지" in caplog.text
+
+
+def _index_state(manager):
+    return (
+        manager.get_all_species(),
+        dict(manager.common_name_index),
+        dict(manager.family_index),
+        manager.get_taxonomy_statistics(),
+    )
+
+
+@pytest.mark.parametrize("manager_class", [TaxonomyManager, CoralTaxonomyManager])
+def test_snapshot_round_trip(tmp_path, manager_class):
+    """save()/load() 후 인덱스와 통계가 원본과 같음"""
+    original = manager_class()
+    snapshot_file = tmp_path / "snapshot.pkl"
+    assert original.save(str(snapshot_file))
+
+    restored = manager_class.load(str(snapshot_file))
+    assert isinstance(restored, manager_class)
+    assert _index_state(restored) == _index_state(original)
+
+
+def test_snapshot_then_merge_matches_fresh_merge(tmp_path):
+    """스냅샷에서 복원한 관리자에 병합해도 새로 만든 관리자에 병합한 결과와 같음"""
+    gobiidae = {
+        "Elacatinus": {"oceanops": ["Neon goby", "Blue neon goby"]},
+        "Newgoby": {"novus": ["New goby"]},
+    }
+    external = {"Osteichthyes": {"Actinopterygii": {"Gobiiformes": {"Gobiidae": gobiidae}}}}
+    taxonomy_file = tmp_path / "extra.json"
+    taxonomy_file.write_text(json.dumps(external), encoding="utf-8")
+
+    fresh = TaxonomyManager()
+    assert fresh.save(str(tmp_path / "snapshot.pkl"))
+    restored = TaxonomyManager.load(str(tmp_path / "snapshot.pkl"))
+    for manager in (fresh, restored):
+        assert manager.load_taxonomy_from_file(str(taxonomy_file))
+    assert _index_state(restored) == _index_state(fresh)
+
+
+def test_snapshot_version_mismatch_rejected(tmp_path, monkeypatch):
+    """스냅샷 버전이 다르면 로드하지 않음"""
+    snapshot_file = tmp_path / "snapshot.pkl"
+    assert TaxonomyManager().save(str(snapshot_file))
+
+    monkeypatch.setattr(
+        taxonomy_manager, "_SNAPSHOT_VERSION", taxonomy_manager._SNAPSHOT_VERSION + 1
+    )
+    assert TaxonomyManager.load(str(snapshot_file)) is None
+
+
+def test_from_cache_without_cache_dir_skips_disk(monkeypatch):
+    """cache_dir와 환경 변수가 모두 없으면 스냅샷을 읽거나 쓰지 않음"""
+    monkeypatch.delenv(taxonomy_manager._CACHE_DIR_ENV, raising=False)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("snapshot I/O without opt-in")
+
+    monkeypatch.setattr(TaxonomyManager, "save", fail)
+    monkeypatch.setattr(TaxonomyManager, "load", classmethod(fail))
+    assert len(TaxonomyManager.from_cache().get_all_species()) > 0
+
+
+def test_from_cache_rebuilds_on_stale_hash(tmp_path, monkeypatch):
+    """데이터가 바뀌어 해시가 달라지면 이전 스냅샷 대신 새로 구성해 저장"""
+    monkeypatch.setenv(taxonomy_manager._CACHE_DIR_ENV, str(tmp_path))
+    TaxonomyManager.from_cache()
+    (first_snapshot,) = tmp_path.glob("*.pkl")
+
+    # 같은 해시면 저장된 스냅샷을 사용
+    loaded = []
+    original_load = TaxonomyManager.load.__func__
+    monkeypatch.setattr(
+        TaxonomyManager,
+        "load",
+        classmethod(lambda cls, path: loaded.append(path) or original_load(cls, path)),
+    )
+    TaxonomyManager.from_cache()
+    assert loaded == [str(first_snapshot)]
+
+    class ChangedFile:
+        name = "Extra.json"
+
+        def read_bytes(self):
+            return b"{}"
+
+    data_files = {**taxonomy_manager._taxonomy_data_files(), "Extra": ChangedFile()}
+    monkeypatch.setattr(taxonomy_manager, "_taxonomy_data_files", lambda: data_files)
+    loaded.clear()
+    TaxonomyManager.from_cache()
+    assert loaded == []
+    assert len(list(tmp_path.glob("*.pkl"))) == 2